@@ -0,0 +1,81 @@
+"""
+Startup-time benchmark for the AI server.
+
+Imports src.ai.api in a fresh interpreter under python -X importtime and
+reports the total import time and the heaviest top-level imports, then
+builds every component (AI_WARMUP=all) in another fresh interpreter and
+reports the per-component import and init timings from /api/health. With
+--budget-ms the script exits non-zero when the API import exceeds the
+budget, so it can guard against components being imported eagerly again.
+
+Usage:
+    python benchmarks/bench_api_startup.py [--top 10] [--budget-ms 1000]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+
+HEALTH_SCRIPT = (
+    "import json; from src.ai.api import app, components; "
+    "print(json.dumps(app.test_client().get('/api/health').get_json())); components.shutdown()"
+)
+
+
+def import_times() -> tuple:
+    """Return the milliseconds to import src.ai.api and (ms, module) for each of its direct imports."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.ai.api"],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    children = []
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package, indented two spaces per level
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        # A module is listed after everything it imports
+        if depth == 0:
+            if name.strip() == "src.ai.api":
+                return int(cumulative) / 1000, children
+            children = []
+        elif depth == 1:
+            children.append((int(cumulative) / 1000, name.strip()))
+    raise RuntimeError("src.ai.api not found in -X importtime output")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--top", type=int, default=10, help="Heaviest imports to list")
+    parser.add_argument("--budget-ms", type=float, default=None, help="Fail when importing the API takes longer")
+    args = parser.parse_args()
+
+    api_ms, children = import_times()
+    print(f"import src.ai.api: {api_ms:.1f} ms")
+    print(f"{'imported by src.ai.api':>30} {'cumulative (ms)':>16}")
+    for ms, name in sorted(children, reverse=True)[:args.top]:
+        print(f"{name:>30} {ms:>16.1f}")
+
+    env = dict(os.environ, AI_WARMUP="all")
+    result = subprocess.run(
+        [sys.executable, "-c", HEALTH_SCRIPT], cwd=ROOT, env=env, capture_output=True, text=True, check=True
+    )
+    services = json.loads(result.stdout.strip().splitlines()[-1])["services"]
+    print(f"\n{'component':>16} {'import (ms)':>12} {'init (ms)':>10}")
+    for name, status in services.items():
+        if status.get("initialized"):
+            print(f"{name:>16} {status['import_seconds'] * 1000:>12.1f} {status['init_seconds'] * 1000:>10.1f}")
+        else:
+            print(f"{name:>16} {'failed: ' + str(status.get('error')):>23}")
+
+    if args.budget_ms is not None and api_ms > args.budget_ms:
+        print(f"\nimport src.ai.api took {api_ms:.1f} ms, over the {args.budget_ms:.0f} ms budget")
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,101 @@
+"""
+Latency and accuracy benchmark for FAQBot matching.
+
+Adds synthetic FAQs to the bot and answers paraphrased questions with the
+full fuzzy scan over every question variant (max_candidates=None), the
+fuzzy n-gram candidate index, and the tfidf engine, reporting mean latency
+and the share of questions answered with the FAQ they paraphrase.
+
+Usage:
+    python benchmarks/bench_faq.py [--sizes 1000 10000] [--queries 200]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ai.faq_bot import FAQBot
+
+TOPICS = [
+    "diaper", "stroller", "car seat", "crib", "bottle", "formula", "pacifier", "baby monitor",
+    "teether", "bib", "baby wipes", "diaper rash cream", "baby carrier", "high chair", "swaddle",
+    "playpen", "bath tub", "nasal aspirator", "thermometer", "breast pump",
+]
+TEMPLATES = [
+    "How often should I replace the {topic} {n}?",
+    "What is the right age for {topic} model {n}?",
+    "How do I clean the {topic} {n}?",
+    "Is the {topic} {n} safe for newborns?",
+    "Where can I buy {topic} {n} in India?",
+]
+PARAPHRASES = [
+    "how often replace {topic} {n}",
+    "right age for {topic} {n}",
+    "cleaning {topic} {n}",
+    "is {topic} {n} safe for a newborn",
+    "buy {topic} {n} india",
+]
+
+
+ENGINES = {
+    "fuzzy full scan": dict(engine="fuzzy", max_candidates=None),
+    "fuzzy indexed": dict(engine="fuzzy", max_candidates=50),
+    "tfidf": dict(engine="tfidf"),
+}
+
+
+def make_bot(num_faqs: int, **kwargs) -> FAQBot:
+    bot = FAQBot(**kwargs)
+    for i in range(num_faqs):
+        topic, n = TOPICS[i % len(TOPICS)], i // len(TOPICS)
+        bot.add_faq(
+            f"synthetic_{i}",
+            {"en": [t.format(topic=topic, n=n) for t in TEMPLATES], "hi": []},
+            {"en": f"Answer {i}", "hi": f"उत्तर {i}"},
+        )
+    return bot
+
+
+def make_queries(num_faqs: int, num_queries: int, seed: int = 0) -> list:
+    """Return (paraphrased question, expected answer) pairs."""
+    rng = random.Random(seed)
+    queries = []
+    for _ in range(num_queries):
+        i = rng.randrange(num_faqs)
+        template = rng.choice(PARAPHRASES)
+        queries.append((template.format(topic=TOPICS[i % len(TOPICS)], n=i // len(TOPICS)), f"Answer {i}"))
+    return queries
+
+
+def run_queries(bot: FAQBot, queries: list) -> tuple:
+    """Return (mean latency in ms, accuracy) over the queries."""
+    # The first tfidf query fits the index, which is a one-off startup cost
+    bot.get_answer(queries[0][0])
+    start = time.perf_counter()
+    answers = [bot.get_answer(q) for q, _ in queries]
+    latency_ms = (time.perf_counter() - start) / len(queries) * 1000
+    correct = sum(a is not None and a["answer"] == expected for a, (_, expected) in zip(answers, queries))
+    return latency_ms, correct / len(queries)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--queries", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{'FAQs':>8} {'engine':>16} {'latency (ms)':>13} {'accuracy':>9}")
+    for n in args.sizes:
+        queries = make_queries(n, args.queries)
+        for name, kwargs in ENGINES.items():
+            # The full scan is slow at 10k FAQs, so run it on a subset of the queries
+            subset = queries[:max(10, len(queries) // 10)] if kwargs.get("max_candidates", 1) is None else queries
+            latency_ms, accuracy = run_queries(make_bot(n, **kwargs), subset)
+            print(f"{n:>8} {name:>16} {latency_ms:>13.2f} {accuracy:>9.0%}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,72 @@
+"""
+Latency and peak memory benchmark for ImageOptimizer decoding.
+
+Generates large JPEG and PNG inputs and optimizes each one in a fresh
+process, with and without fast (draft/reduced-scale) decoding, reporting
+wall time and the process's peak resident memory.
+
+Usage:
+    python benchmarks/bench_image_optimizer.py
+"""
+import io
+import multiprocessing
+import os
+import resource
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PIL import Image, ImageDraw
+
+from src.ai.image_optimizer import ImageOptimizer
+
+INPUTS = [
+    ("JPEG 24MP", (6000, 4000), "JPEG"),
+    ("JPEG 12MP", (4000, 3000), "JPEG"),
+    ("PNG 12MP", (4000, 3000), "PNG"),
+]
+
+
+def make_image(size: tuple, format: str) -> bytes:
+    """A gradient with shapes, so encoders have real detail to compress."""
+    img = Image.linear_gradient("L").resize(size).convert("RGB")
+    draw = ImageDraw.Draw(img)
+    for i in range(0, size[0], 200):
+        draw.ellipse((i, i % size[1], i + 300, (i % size[1]) + 300), fill=(i % 255, 120, 200))
+    output = io.BytesIO()
+    img.save(output, format=format)
+    return output.getvalue()
+
+
+def run(image_data: bytes, fast_decode: bool, queue) -> None:
+    # Peak RSS is per process, so the baseline is taken after the input exists
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    ImageOptimizer(fast_decode=fast_decode, max_pixels=100_000_000).optimize_image(image_data)
+    elapsed = time.perf_counter() - start
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    queue.put((elapsed, (peak - baseline) / 1024))
+
+
+def measure(image_data: bytes, fast_decode: bool) -> tuple:
+    queue = multiprocessing.Queue()
+    process = multiprocessing.Process(target=run, args=(image_data, fast_decode, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+
+def main() -> None:
+    print(f"{'input':>10} {'decode':>8} {'time (ms)':>10} {'peak +RSS (MB)':>15}")
+    for name, size, format in INPUTS:
+        image_data = make_image(size, format)
+        for fast_decode in (False, True):
+            elapsed, peak_mb = measure(image_data, fast_decode)
+            label = "fast" if fast_decode else "full"
+            print(f"{name:>10} {label:>8} {elapsed * 1000:>10.0f} {peak_mb:>15.0f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,95 @@
+"""
+Encode time vs. output size per ImageOptimizer profile and format.
+
+Encodes a fixed corpus of generated 800x800 images (photo-like gradient,
+noisy texture, flat graphic) with every profile and format, and reports
+mean encode time and output size. A target-size run shows how many
+encodes the quality search needs.
+
+Usage:
+    python benchmarks/bench_image_profiles.py [--repeats 3]
+"""
+import argparse
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from PIL import Image, ImageDraw
+
+from src.ai.image_optimizer import ImageOptimizer
+
+SIZE = (800, 800)
+
+
+def photo_like() -> Image.Image:
+    img = Image.linear_gradient("L").resize(SIZE).convert("RGB")
+    draw = ImageDraw.Draw(img)
+    for i in range(0, SIZE[0], 80):
+        draw.ellipse((i, i, i + 160, i + 120), fill=(i % 255, 120, 200))
+    return img
+
+
+def noisy() -> Image.Image:
+    return Image.effect_noise(SIZE, 40).convert("RGB")
+
+
+def flat_graphic() -> Image.Image:
+    rng = random.Random(0)
+    img = Image.new("RGB", SIZE, (255, 255, 255))
+    draw = ImageDraw.Draw(img)
+    for _ in range(40):
+        x, y = rng.randrange(SIZE[0]), rng.randrange(SIZE[1])
+        draw.rectangle((x, y, x + 120, y + 60), fill=(rng.randrange(256), rng.randrange(256), 80))
+    return img
+
+
+CORPUS = {"photo": photo_like, "noise": noisy, "graphic": flat_graphic}
+
+
+def encode_corpus() -> dict:
+    """Corpus images as lossless PNG bytes, the way uploads arrive."""
+    corpus = {}
+    for name, make in CORPUS.items():
+        output = io.BytesIO()
+        make().save(output, format="PNG")
+        corpus[name] = output.getvalue()
+    return corpus
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    optimizer = ImageOptimizer()
+    corpus = encode_corpus()
+
+    print(f"{'image':>8} {'format':>6} {'profile':>9} {'time (ms)':>10} {'size (KB)':>10}")
+    for name, image_data in corpus.items():
+        for format in optimizer.get_supported_formats():
+            for profile in optimizer.get_profiles():
+                start = time.perf_counter()
+                for _ in range(args.repeats):
+                    result = optimizer.optimize_image(image_data, format=format, profile=profile)
+                elapsed_ms = (time.perf_counter() - start) / args.repeats * 1000
+                print(f"{name:>8} {format:>6} {profile:>9} {elapsed_ms:>10.1f} "
+                      f"{result['optimized_weight_kb']:>10.1f}")
+
+    print()
+    print(f"{'image':>8} {'format':>6} {'target (KB)':>12} {'size (KB)':>10} {'quality':>8} {'encodes':>8}")
+    for name, image_data in corpus.items():
+        for format in ("WEBP", "JPEG"):
+            for target_kb in (20, 50):
+                result = optimizer.optimize_image(
+                    image_data, format=format, profile="balanced", target_kb=target_kb
+                )
+                print(f"{name:>8} {format:>6} {target_kb:>12} {result['optimized_weight_kb']:>10.1f} "
+                      f"{result['quality']:>8} {result['encode_attempts']:>8}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,98 @@
+"""
+Memory and latency benchmark for the product recommender.
+
+Builds synthetic catalogs of increasing size and reports fit time, peak
+memory during fit, the size of the neighbor index and the per-request
+latency of get_recommendations, both for requests served from the
+neighbor index and for larger requests ranked on the fly. The dense N x N float64 matrix the
+recommender used to keep is shown for comparison.
+
+Usage:
+    python benchmarks/bench_recommender.py [--sizes 1000 10000 100000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ai.recommendation import ProductRecommender
+
+CATEGORIES = ["Diapers", "Strollers", "Toys", "Feeding", "Bath", "Clothing", "Nursery"]
+BRANDS = ["BabyComfort", "TinySteps", "LittleOne", "CuddleCo", "Mamaearth", "Himalaya"]
+WORDS = (
+    "soft absorbent leak proof organic cotton gentle rash free lightweight foldable "
+    "compact sturdy washable hypoallergenic ergonomic adjustable reclining padded "
+    "safe durable colorful musical educational wooden plastic bpa silicone bottle "
+    "nipple wipes lotion shampoo blanket swaddle crib mattress carrier seat travel "
+    "newborn infant toddler night day pack premium natural fragrance sensitive skin"
+).split()
+
+
+def make_products(n: int, seed: int = 0) -> list:
+    """Generate n synthetic products with a realistic vocabulary."""
+    rng = random.Random(seed)
+    return [
+        {
+            "id": str(i),
+            "name": " ".join(rng.choices(WORDS, k=3)),
+            "description": " ".join(rng.choices(WORDS, k=12)),
+            "category": rng.choice(CATEGORIES),
+            "brand": rng.choice(BRANDS),
+        }
+        for i in range(n)
+    ]
+
+
+def time_requests(recommender: ProductRecommender, ids: list, num_recommendations: int) -> float:
+    """Return the mean get_recommendations latency in microseconds."""
+    start = time.perf_counter()
+    for product_id in ids:
+        recommender.get_recommendations(product_id, num_recommendations)
+    return (time.perf_counter() - start) / len(ids) * 1e6
+
+
+def bench(n: int, num_requests: int = 1000) -> dict:
+    products = make_products(n)
+
+    tracemalloc.start()
+    start = time.perf_counter()
+    recommender = ProductRecommender(products)
+    fit_seconds = time.perf_counter() - start
+    _, peak_bytes = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    ids = [str(i) for i in random.Random(1).choices(range(n), k=num_requests)]
+    request_us = time_requests(recommender, ids, 3)
+    ranked_us = time_requests(recommender, ids[:100], recommender.num_neighbors + 30)
+
+    index_bytes = recommender.neighbor_ids.nbytes + recommender.neighbor_scores.nbytes
+    return {
+        "n": n,
+        "fit_s": fit_seconds,
+        "peak_mb": peak_bytes / 2**20,
+        "index_mb": index_bytes / 2**20,
+        "dense_mb": n * n * 8 / 2**20,
+        "request_us": request_us,
+        "ranked_us": ranked_us,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'products':>10} {'fit (s)':>9} {'peak (MB)':>10} {'index (MB)':>11} "
+          f"{'dense NxN (MB)':>15} {'request (us)':>13} {'ranked (us)':>12}")
+    for n in args.sizes:
+        r = bench(n)
+        print(f"{r['n']:>10} {r['fit_s']:>9.2f} {r['peak_mb']:>10.1f} {r['index_mb']:>11.2f} "
+              f"{r['dense_mb']:>15.0f} {r['request_us']:>13.1f} {r['ranked_us']:>12.1f}")
+
+
+if __name__ == '__main__':
+    main()
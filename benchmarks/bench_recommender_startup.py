@@ -0,0 +1,49 @@
+"""
+Startup-time benchmark for the product recommender.
+
+Compares a cold fit against loading a saved artifact, both memory-mapped
+and fully read into memory, for synthetic catalogs of increasing size.
+
+Usage:
+    python benchmarks/bench_recommender_startup.py [--sizes 1000 10000 100000]
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ai.recommendation import ProductRecommender
+from bench_recommender import make_products
+
+
+def timed(fn) -> tuple:
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    print(f"{'products':>10} {'cold fit (s)':>13} {'load mmap (ms)':>15} {'load full (ms)':>15}")
+    for n in args.sizes:
+        products = make_products(n)
+        recommender, fit_seconds = timed(lambda: ProductRecommender(products))
+
+        with tempfile.TemporaryDirectory() as path:
+            recommender.save(path)
+            mmapped, mmap_seconds = timed(lambda: ProductRecommender.load(path))
+            _, full_seconds = timed(lambda: ProductRecommender.load(path, mmap_mode=None))
+            # Sanity check that the artifact serves the same neighbors
+            assert mmapped.get_recommendations("0") == recommender.get_recommendations("0")
+
+        print(f"{n:>10} {fit_seconds:>13.2f} {mmap_seconds * 1000:>15.1f} {full_seconds * 1000:>15.1f}")
+
+
+if __name__ == '__main__':
+    main()
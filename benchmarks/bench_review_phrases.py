@@ -0,0 +1,80 @@
+"""
+Throughput benchmark for ReviewAnalyzer phrase extraction.
+
+Extracts sentiment phrases from synthetic reviews with the original
+extraction, which joins every 3-5 word window and scans the sentiment
+lexicon for each, and with the current single-pass extraction, and checks
+that both produce identical phrases.
+
+Usage:
+    python benchmarks/bench_review_phrases.py [--reviews 100000] [--words 60]
+"""
+import argparse
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ai.review_analyzer import ReviewAnalyzer
+
+FILLER = (
+    "the this product for my baby was very it and we bought after using a few weeks "
+    "delivery packaging size fits daughter son night day material strap seat wheels"
+).split()
+
+
+def make_reviews(n: int, words: int, analyzer: ReviewAnalyzer, seed: int = 0) -> list:
+    """Generate n reviews of about the given length, roughly one word in ten from the lexicon."""
+    rng = random.Random(seed)
+    lexicon = analyzer.sentiment_words["en"]["positive"] + analyzer.sentiment_words["en"]["negative"]
+    reviews = []
+    for _ in range(n):
+        length = rng.randint(words // 2, words * 3 // 2)
+        tokens = [rng.choice(lexicon).capitalize() if rng.random() < 0.1 else rng.choice(FILLER) for _ in range(length)]
+        reviews.append(" ".join(tokens) + rng.choice([".", "!", "?"]))
+    return reviews
+
+
+def legacy_extract_phrases(analyzer: ReviewAnalyzer, text: str, language: str) -> list:
+    """The original extraction, joining and scanning every window."""
+    text = re.sub(r'[^\w\s]', ' ', text)
+    words = text.split()
+    phrases = []
+    for i in range(len(words)):
+        for j in range(analyzer.min_phrase_length, analyzer.max_phrase_length + 1):
+            if i + j <= len(words):
+                phrase = ' '.join(words[i:i+j])
+                if any(word in phrase.lower() for word in analyzer.sentiment_words[language]["positive"]) or \
+                   any(word in phrase.lower() for word in analyzer.sentiment_words[language]["negative"]):
+                    phrases.append(phrase)
+    return phrases
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--reviews", type=int, default=100000)
+    parser.add_argument("--words", type=int, default=60, help="Mean words per review")
+    args = parser.parse_args()
+
+    analyzer = ReviewAnalyzer()
+    reviews = make_reviews(args.reviews, args.words, analyzer)
+
+    start = time.perf_counter()
+    legacy = [legacy_extract_phrases(analyzer, text, "en") for text in reviews]
+    legacy_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    current = [analyzer._extract_phrases(text, "en") for text in reviews]
+    current_seconds = time.perf_counter() - start
+
+    print(f"{'extraction':>12} {'seconds':>9} {'reviews/s':>11}")
+    print(f"{'original':>12} {legacy_seconds:>9.2f} {len(reviews) / legacy_seconds:>11,.0f}")
+    print(f"{'single-pass':>12} {current_seconds:>9.2f} {len(reviews) / current_seconds:>11,.0f}")
+    print(f"speedup {legacy_seconds / current_seconds:.1f}x, identical output: {legacy == current}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,80 @@
+"""
+Throughput and agreement benchmark for ReviewAnalyzer sentiment backends.
+
+Scores synthetic English reviews (including negated phrases) with the
+per-review TextBlob backend and the batched lexicon backend, reporting
+reviews per second, the share of reviews both put in the same
+positive/neutral/negative class (the 0.1 threshold generate_summary uses)
+and the correlation of their polarities. Hindi reviews, which TextBlob
+scores as neutral, are timed for the lexicon backend only.
+
+Usage:
+    python benchmarks/bench_sentiment.py [--reviews 20000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ai.sentiment import LexiconSentiment, TextBlobSentiment
+
+EN_OPENERS = ["This stroller is", "The diapers are", "My baby finds this toy", "The car seat was", "Delivery was"]
+EN_WORDS = ["good", "great", "excellent", "comfortable", "amazing", "bad", "poor", "expensive", "broken", "terrible", "okay"]
+EN_CLOSERS = ["for the price.", "after a month of use.", "and I would buy again.", "overall.", ""]
+HI_OPENERS = ["यह उत्पाद", "डायपर", "स्ट्रोलर", "खिलौना"]
+HI_WORDS = ["अच्छा", "बढ़िया", "शानदार", "खराब", "घटिया", "महंगा", "ठीक"]
+
+
+def make_reviews(n: int, seed: int = 0) -> tuple:
+    """Generate n English and n Hindi reviews, some with negations."""
+    rng = random.Random(seed)
+    english, hindi = [], []
+    for _ in range(n):
+        negation = rng.random() < 0.2
+        english.append(" ".join([
+            rng.choice(EN_OPENERS), "not" if negation else "really", rng.choice(EN_WORDS),
+            "and", rng.choice(EN_WORDS), rng.choice(EN_CLOSERS)
+        ]))
+        hindi.append(" ".join([
+            rng.choice(HI_OPENERS), "बहुत", rng.choice(HI_WORDS), "नहीं है" if negation else "है"
+        ]))
+    return english, hindi
+
+
+def classify(scores: np.ndarray) -> np.ndarray:
+    return np.where(scores > 0.1, 1, np.where(scores < -0.1, -1, 0))
+
+
+def timed(backend, texts: list, language: str) -> tuple:
+    start = time.perf_counter()
+    scores = np.asarray(backend.score_batch(texts, language))
+    return scores, len(texts) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--reviews", type=int, default=20000)
+    args = parser.parse_args()
+
+    english, hindi = make_reviews(args.reviews)
+    textblob_scores, textblob_rate = timed(TextBlobSentiment(), english, "en")
+    lexicon = LexiconSentiment()
+    lexicon_scores, lexicon_rate = timed(lexicon, english, "en")
+    _, hindi_rate = timed(lexicon, hindi, "hi")
+
+    print(f"{'backend':>10} {'language':>9} {'reviews/s':>11}")
+    print(f"{'textblob':>10} {'en':>9} {textblob_rate:>11,.0f}")
+    print(f"{'lexicon':>10} {'en':>9} {lexicon_rate:>11,.0f}")
+    print(f"{'lexicon':>10} {'hi':>9} {hindi_rate:>11,.0f}")
+    agreement = np.mean(classify(textblob_scores) == classify(lexicon_scores))
+    correlation = np.corrcoef(textblob_scores, lexicon_scores)[0, 1]
+    print(f"class agreement with textblob: {agreement:.1%}, polarity correlation: {correlation:.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,105 @@
+"""
+Throughput benchmark for batch SEO generation.
+
+Renders SEO metadata for a synthetic catalog with one generate_seo call per
+product, as the nightly job did through /api/generate-seo, and with
+generate_seo_batch, which compiles the templates once. The original
+str.format rendering is shown for comparison, as is generate_seo served
+from a memo cache warmed with the catalog.
+
+Usage:
+    python benchmarks/bench_seo.py [--sizes 10000 100000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+from collections import deque
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from src.ai.seo_generator import SEOGenerator
+
+CATEGORIES = ["Diapers", "Strollers", "Toys", "Feeding", "Bath"]
+BRANDS = ["BabyComfort", "TinySteps", "LittleOne", "CuddleCo", "Mamaearth", "Himalaya"]
+
+
+def make_products(n: int, seed: int = 0) -> list:
+    """Generate n synthetic products."""
+    rng = random.Random(seed)
+    return [
+        {
+            "id": str(i),
+            "name": f"{rng.choice(['Premium', 'Soft', 'Organic', 'Deluxe'])} Baby Product {i}",
+            "category": rng.choice(CATEGORIES),
+            "brand": rng.choice(BRANDS),
+            "discount": rng.choice(["", 10, 25]),
+            "image": f"https://example.com/images/{i}.jpg",
+        }
+        for i in range(n)
+    ]
+
+
+def format_seo(generator: SEOGenerator, product: dict, language: str, template_type: str) -> dict:
+    """The original rendering, parsing every template with str.format per call."""
+    features = generator.category_features.get(product.get("category", ""), {"en": [], "hi": []})
+    context = {
+        "product_name": product.get("name", ""),
+        "brand": product.get("brand", ""),
+        "category": product.get("category", ""),
+        "discount": product.get("discount", ""),
+        "key_feature": features[language][0] if features[language] else "",
+    }
+    title = generator.templates["title"][language][template_type].format(**context)
+    description = generator.templates["description"][language][template_type].format(**context)
+    keywords = [k.format(**context) for k in generator.templates["keywords"][language]]
+    keywords.extend(features[language])
+    title = generator._truncate_title(title)
+    description = generator._truncate_description(description)
+    return {
+        "title": title,
+        "description": description,
+        "keywords": ", ".join(keywords),
+        "og:title": title,
+        "og:description": description,
+        "og:type": "product",
+        "og:image": product.get("image", ""),
+        "twitter:card": "product",
+        "twitter:title": title,
+        "twitter:description": description,
+        "twitter:image": product.get("image", ""),
+    }
+
+
+def throughput(render, products: list) -> float:
+    """Return products rendered per second."""
+    start = time.perf_counter()
+    deque(render(products), maxlen=0)
+    return len(products) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    args = parser.parse_args()
+
+    generator = SEOGenerator()
+    modes = {
+        "str.format": lambda ps: (format_seo(generator, p, "en", "default") for p in ps),
+        "generate_seo": lambda ps: (generator.generate_seo(p, "en", "default") for p in ps),
+        "generate_seo_batch": lambda ps: generator.generate_seo_batch(ps, "en", "default"),
+    }
+
+    print(f"{'products':>9} {'mode':>20} {'products/s':>12}")
+    for n in args.sizes:
+        products = make_products(n)
+        cached = SEOGenerator(cache_size=n)
+        cached.warm_cache(products, languages=["en"], template_types=["default"])
+        modes["generate_seo cached"] = lambda ps: (cached.generate_seo(p, "en", "default") for p in ps)
+        for name, render in modes.items():
+            print(f"{n:>9} {name:>20} {throughput(render, products):>12,.0f}")
+
+
+if __name__ == '__main__':
+    main()
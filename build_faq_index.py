@@ -0,0 +1,30 @@
+"""
+Compile FAQ files into the binary format loaded by the AI server.
+
+Loads the built-in FAQs plus any JSON/JSONL files given, normalizes and
+indexes every question variant once, and writes a .faqc file. Point
+FAQ_DATA_PATH at that file so workers start without re-indexing.
+
+Usage:
+    python build_faq_index.py faqs.jsonl [more.json ...] --output src/data/faqs.faqc
+"""
+import argparse
+import os
+import time
+
+from src.ai.faq_bot import FAQBot
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(__file__), 'src', 'data', 'faqs.faqc')
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Compile FAQ files into a .faqc index.')
+    parser.add_argument('inputs', nargs='*', help='JSON or JSONL FAQ files')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='Compiled file to write')
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    bot = FAQBot()
+    for path in args.inputs:
+        print(f"Loaded {bot.load_faqs(path)} FAQ records from {path}")
+    bot.save_compiled(args.output)
+    print(f"Compiled {len(bot.faqs)} FAQs in {time.perf_counter() - start:.2f}s: {args.output}")
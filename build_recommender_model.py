@@ -0,0 +1,35 @@
+"""
+Build the recommender model artifact offline.
+
+Fits the recommender on src/data/products.json and saves it to the given
+directory. Point RECOMMENDER_MODEL_PATH at that directory so the AI server
+memory-maps the artifact at startup instead of fitting.
+
+Usage:
+    python build_recommender_model.py [--output src/data/recommender_model]
+"""
+import argparse
+import json
+import os
+import time
+
+from src.ai.recommendation import ProductRecommender
+
+DEFAULT_PRODUCTS = os.path.join(os.path.dirname(__file__), 'src', 'data', 'products.json')
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(__file__), 'src', 'data', 'recommender_model')
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Build the recommender model artifact.')
+    parser.add_argument('--products', default=DEFAULT_PRODUCTS, help='Path to products.json')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='Artifact directory to write')
+    parser.add_argument('--num-neighbors', type=int, default=20, help='Neighbors kept per product')
+    args = parser.parse_args()
+
+    with open(args.products, 'r', encoding='utf-8') as f:
+        products = json.load(f)['products']
+
+    start = time.perf_counter()
+    recommender = ProductRecommender(products, num_neighbors=args.num_neighbors)
+    recommender.save(args.output)
+    print(f"Built recommender model for {len(products)} products in "
+          f"{time.perf_counter() - start:.2f}s: {args.output}")
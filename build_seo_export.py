@@ -0,0 +1,164 @@
+"""
+Export pre-rendered SEO metadata and sitemaps for the static site build.
+
+Streams the catalog in shards of 50k products and, for every shard, writes
+one JSON file per language and template type (product id -> metadata) plus
+a sitemap of the shard's product URLs, then a sitemap.xml index. A
+manifest records each shard's content hash, so later runs only rewrite
+shards whose products (or the SEO templates) changed.
+
+Usage:
+    python build_seo_export.py [--catalog src/data/products.json] [--output public]
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from datetime import date
+from itertools import islice
+from typing import Dict, List
+from xml.sax.saxutils import escape
+
+from src.ai.seo_generator import SEOGenerator, iter_catalog
+
+DEFAULT_OUTPUT = os.path.join(os.path.dirname(__file__), 'public')
+DEFAULT_BASE_URL = 'https://babyhub.info'
+SHARD_SIZE = 50000
+MANIFEST_NAME = 'seo/manifest.json'
+SITEMAP_NS = 'http://www.sitemaps.org/schemas/sitemap/0.9'
+
+def write_atomic(path: str, data: str) -> None:
+    """Write a file via a temporary file so readers never see a partial shard."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
+def generator_fingerprint(generator: SEOGenerator, base_url: str) -> str:
+    """Hash everything besides the products that affects the output files."""
+    config = [generator.templates, generator.category_features, base_url]
+    return hashlib.sha256(json.dumps(config, sort_keys=True).encode('utf-8')).hexdigest()
+
+def shard_hash(products: List[Dict], fingerprint: str) -> str:
+    """Content hash of a shard's source products."""
+    digest = hashlib.sha256(fingerprint.encode('utf-8'))
+    for product in products:
+        digest.update(json.dumps(product, sort_keys=True).encode('utf-8'))
+    return digest.hexdigest()
+
+def shard_files(shard: int, generator: SEOGenerator) -> List[str]:
+    """Paths of a shard's files, relative to the output directory."""
+    files = [f"sitemaps/sitemap-{shard:05d}.xml"]
+    for language in generator.get_supported_languages():
+        for template_type in generator.get_template_types():
+            files.append(f"seo/{language}/{template_type}/{shard:05d}.json")
+    return files
+
+def write_shard(output: str, shard: int, products: List[Dict], generator: SEOGenerator, base_url: str) -> None:
+    """Render and write every language/template file and the sitemap of a shard."""
+    for language in generator.get_supported_languages():
+        for template_type in generator.get_template_types():
+            results = generator.generate_seo_batch(products, language=language, template_type=template_type)
+            metadata = {str(product.get('id')): seo_data for product, seo_data in zip(products, results)}
+            write_atomic(
+                os.path.join(output, 'seo', language, template_type, f"{shard:05d}.json"),
+                json.dumps(metadata, ensure_ascii=False)
+            )
+
+    urls = ''.join(
+        f"  <url><loc>{escape(base_url + '/product/' + str(product.get('id')))}</loc></url>\n"
+        for product in products
+    )
+    write_atomic(
+        os.path.join(output, 'sitemaps', f"sitemap-{shard:05d}.xml"),
+        f'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="{SITEMAP_NS}">\n{urls}</urlset>\n'
+    )
+
+def write_sitemap_index(output: str, shards: List[Dict], base_url: str) -> None:
+    """Write sitemap.xml pointing at every shard sitemap."""
+    entries = ''.join(
+        f"  <sitemap><loc>{escape(base_url)}/sitemaps/sitemap-{i:05d}.xml</loc>"
+        f"<lastmod>{shard['lastmod']}</lastmod></sitemap>\n"
+        for i, shard in enumerate(shards)
+    )
+    write_atomic(
+        os.path.join(output, 'sitemap.xml'),
+        f'<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="{SITEMAP_NS}">\n{entries}</sitemapindex>\n'
+    )
+
+def load_manifest(output: str) -> Dict:
+    """Load the previous run's manifest, or an empty one."""
+    try:
+        with open(os.path.join(output, MANIFEST_NAME), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {'shards': []}
+
+def export(catalog: str, output: str, base_url: str, shard_size: int = SHARD_SIZE, force: bool = False) -> Dict[str, int]:
+    """
+    Export SEO metadata and sitemaps, rewriting only changed shards.
+
+    Args:
+        catalog: Path to the products JSON file
+        output: Directory to write into (the static site's public directory)
+        base_url: Site URL used in sitemaps
+        shard_size: Products per shard, at most 50k for sitemaps
+        force: Rewrite every shard regardless of the manifest
+
+    Returns:
+        Counts of products, shards, and shards written and removed
+    """
+    generator = SEOGenerator()
+    fingerprint = generator_fingerprint(generator, base_url)
+    previous = load_manifest(output)['shards']
+    shards = []
+    stats = {'products': 0, 'written': 0, 'removed': 0}
+
+    products_iter = iter_catalog(catalog)
+    while True:
+        products = list(islice(products_iter, shard_size))
+        if not products:
+            break
+        index = len(shards)
+        content_hash = shard_hash(products, fingerprint)
+        files_exist = all(os.path.exists(os.path.join(output, f)) for f in shard_files(index, generator))
+
+        if not force and files_exist and index < len(previous) and previous[index]['hash'] == content_hash:
+            shards.append(previous[index])
+        else:
+            write_shard(output, index, products, generator, base_url)
+            shards.append({'hash': content_hash, 'products': len(products), 'lastmod': date.today().isoformat()})
+            stats['written'] += 1
+        stats['products'] += len(products)
+
+    # Remove shards left over from a larger catalog
+    for index in range(len(shards), len(previous)):
+        for path in shard_files(index, generator):
+            if os.path.exists(os.path.join(output, path)):
+                os.remove(os.path.join(output, path))
+        stats['removed'] += 1
+
+    write_sitemap_index(output, shards, base_url)
+    # The manifest is written last so an interrupted run is redone next time
+    write_atomic(os.path.join(output, MANIFEST_NAME), json.dumps({'shards': shards}, indent=2))
+    stats['shards'] = len(shards)
+    return stats
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Export static SEO metadata and sitemaps.')
+    parser.add_argument('--catalog', default=None, help='Path to products.json')
+    parser.add_argument('--output', default=DEFAULT_OUTPUT, help='Directory to write into')
+    parser.add_argument('--base-url', default=DEFAULT_BASE_URL, help='Site URL used in sitemaps')
+    parser.add_argument('--shard-size', type=int, default=SHARD_SIZE, help='Products per shard (max 50000)')
+    parser.add_argument('--force', action='store_true', help='Rewrite every shard')
+    args = parser.parse_args()
+    if not 0 < args.shard_size <= SHARD_SIZE:
+        parser.error(f'--shard-size must be between 1 and {SHARD_SIZE}')
+
+    start = time.perf_counter()
+    stats = export(args.catalog, args.output, args.base_url.rstrip('/'), args.shard_size, args.force)
+    print(f"Exported SEO for {stats['products']} products in {stats['shards']} shards "
+          f"({stats['written']} written, {stats['removed']} removed) in "
+          f"{time.perf_counter() - start:.2f}s: {args.output}")
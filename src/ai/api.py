@@ -1,13 +1,35 @@
-from flask import Flask, request, jsonify
+from flask import Flask, Response, g, request, jsonify, url_for
 from flask_cors import CORS
-from .recommendation import create_recommender
-from .faq_bot import create_faq_bot
-from .image_optimizer import create_optimizer
-from .seo_generator import create_seo_generator
-from .review_analyzer import create_review_analyzer
+from .components import ComponentError, create_component_registry
+from .metrics import create_metrics, create_sampled_logger
+from .profiling import create_request_profiler
+from .image_jobs import QueueFullError
+from .seo_generator import iter_catalog
+import base64
+import hmac
+import io
 import json
+import tarfile
+import zipfile
 from typing import Dict, Any
+import logging
 import os
+import time
+
+logging.basicConfig(
+    level=os.environ.get('LOG_LEVEL', 'INFO'),
+    format='%(asctime)s %(levelname)s %(name)s: %(message)s'
+)
+logger = logging.getLogger(__name__)
+# Per-request logs on hot paths are sampled; warnings and errors always pass
+request_logger = create_sampled_logger('src.ai.requests', float(os.environ.get('LOG_SAMPLE_RATE', '0.01')))
+metrics = create_metrics()
+# Opt-in request profiling, triggered by an X-Profile header or by sampling
+profiler = create_request_profiler(
+    enabled=os.environ.get('PROFILING_ENABLED', 'false') == 'true',
+    sample_rate=float(os.environ.get('PROFILING_SAMPLE_RATE', '0')),
+    max_profiles=int(os.environ.get('PROFILING_MAX_PROFILES', '20'))
+)
 
 app = Flask(__name__)
 # Enable CORS for development
@@ -19,69 +41,360 @@ CORS(app, resources={
             "http://localhost:5001",
             "http://127.0.0.1:5001"
         ],
-        "methods": ["GET", "POST", "OPTIONS"],
-        "allow_headers": ["Content-Type", "Accept"],
+        "methods": ["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+        "allow_headers": ["Content-Type", "Accept", "X-Admin-Token", "X-Profile"],
         "supports_credentials": True
     }
 })
 
-# Initialize AI components
-recommender = None
-faq_bot = create_faq_bot()
-image_optimizer = create_optimizer()
-seo_generator = create_seo_generator()
-review_analyzer = create_review_analyzer()
-
 def load_products() -> Dict[str, Any]:
     """Load products from JSON file."""
     try:
         products_path = os.path.join(os.path.dirname(__file__), '..', 'data', 'products.json')
-        print(f"Loading products from: {products_path}")
+        logger.info("Loading products from: %s", products_path)
         with open(products_path, 'r', encoding='utf-8') as f:
             data = json.load(f)
-            print(f"Loaded {len(data.get('products', []))} products")
+            logger.info("Loaded %d products", len(data.get('products', [])))
             return data
     except Exception as e:
-        print(f"Error loading products: {e}")
+        logger.error("Error loading products: %s", e)
         return {"products": [], "categories": []}
 
-# Initialize recommender with products
-try:
-    products_data = load_products()
-    if products_data['products']:
-        print("Initializing recommender with products...")
-        recommender = create_recommender(products_data['products'])
-        print("Recommender initialized successfully")
-    else:
-        print("No products found to initialize recommender")
-except Exception as e:
-    print(f"Error initializing recommender: {e}")
+def build_recommender(module):
+    """Fit (or load) the recommender, or None when it cannot be initialized."""
+    try:
+        products_data = components.get('products')
+        if not products_data['products']:
+            logger.warning("No products found to initialize recommender")
+            return None
+        logger.info("Initializing recommender with products...")
+        recommender = module.create_recommender(
+            products_data['products'],
+            model_path=os.environ.get('RECOMMENDER_MODEL_PATH')
+        )
+        recommender.start_background_refit()
+        logger.info("Recommender initialized successfully")
+        return recommender
+    except Exception as e:
+        logger.error("Error initializing recommender: %s", e)
+        return None
+
+def build_seo_generator(module):
+    seo_generator = module.create_seo_generator(cache_size=int(os.environ.get('SEO_CACHE_SIZE', '4096')))
+    # Warm the SEO cache with the catalog so product pages hit it from the start
+    try:
+        if os.environ.get('SEO_CACHE_WARM', 'true') == 'true':
+            logger.info("Warmed SEO cache with %d results", seo_generator.warm_cache(components.get('products')['products']))
+    except Exception as e:
+        logger.error("Error warming SEO cache: %s", e)
+    return seo_generator
+
+# AI components are imported and built on first use; AI_WARMUP builds them up front
+image_cache_options = {
+    'cache_dir': os.environ.get('IMAGE_CACHE_DIR'),
+    'cache_max_bytes': int(os.environ.get('IMAGE_CACHE_MAX_MB', '512')) * 1024 * 1024
+}
+components = create_component_registry(package=__package__)
+components.register('products', lambda _: load_products())
+components.register('recommender', build_recommender, module='.recommendation')
+components.register('faq_bot', lambda module: module.create_faq_bot(
+    engine=os.environ.get('FAQ_ENGINE', 'fuzzy'),
+    faq_path=os.environ.get('FAQ_DATA_PATH')
+), module='.faq_bot')
+components.register('image_optimizer', lambda module: module.create_optimizer(**image_cache_options), module='.image_optimizer')
+components.register('image_jobs', lambda module: module.create_image_job_queue(
+    max_workers=int(os.environ['IMAGE_JOB_WORKERS']) if os.environ.get('IMAGE_JOB_WORKERS') else None,
+    optimizer_options=image_cache_options,
+    # Shared by every server worker, so a job can be polled from any of them
+    store_path=os.environ.get('IMAGE_JOBS_DB', os.path.join(os.path.dirname(__file__), '..', 'data', 'image_jobs.sqlite3'))
+), module='.image_jobs')
+components.register('seo_generator', build_seo_generator, module='.seo_generator')
+components.register('review_analyzer', lambda module: module.create_review_analyzer(
+    max_workers=int(os.environ['REVIEW_WORKERS']) if os.environ.get('REVIEW_WORKERS') else None,
+    sentiment_backend=os.environ.get('REVIEW_SENTIMENT_BACKEND', 'textblob')
+), module='.review_analyzer')
+components.register('review_store', lambda module: module.create_review_store(
+    os.environ.get('REVIEW_STORE_PATH', os.path.join(os.path.dirname(__file__), '..', 'data', 'reviews.sqlite3')),
+    analyzer=components.get('review_analyzer')
+), module='.review_store')
+
+# Comma separated component names, or 'all'
+if os.environ.get('AI_WARMUP'):
+    warmup = os.environ['AI_WARMUP']
+    components.warmup(None if warmup == 'all' else [name.strip() for name in warmup.split(',')])
+
+def component_timer(component: str, operation: str):
+    """Time an AI component call into the component latency histogram."""
+    return metrics.timer(
+        'ai_component_duration_seconds', 'Latency of AI component calls',
+        component=component, operation=operation
+    )
+
+def collect_component_metrics() -> list:
+    """Cache and queue metrics of the components built so far."""
+    caches = []
+    if components.is_initialized('faq_bot'):
+        caches.append(('faq_answers', components.get('faq_bot').get_cache_stats()))
+    if components.is_initialized('seo_generator'):
+        caches.append(('seo_results', components.get('seo_generator').get_cache_stats()))
+    if components.is_initialized('image_optimizer') and components.get('image_optimizer').cache is not None:
+        caches.append(('images', components.get('image_optimizer').cache.get_stats()))
+    
+    families = [
+        ('ai_cache_hits_total', 'counter', 'Cache hits', [({'cache': name}, s['hits']) for name, s in caches]),
+        ('ai_cache_misses_total', 'counter', 'Cache misses', [({'cache': name}, s['misses']) for name, s in caches]),
+        ('ai_cache_hit_ratio', 'gauge', 'Cache hits over lookups', [
+            ({'cache': name}, s['hits'] / (s['hits'] + s['misses']) if s['hits'] + s['misses'] else 0.0)
+            for name, s in caches
+        ]),
+        ('ai_component_initialized', 'gauge', 'Whether a component has been built', [
+            ({'component': name}, int(status['initialized'])) for name, status in components.get_status().items()
+        ])
+    ]
+    if components.is_initialized('image_jobs'):
+        stats = components.get('image_jobs').get_stats()
+        families.append(('ai_image_jobs_pending', 'gauge', 'Queued or running image jobs', [({}, stats['queue_depth'])]))
+    return families
+
+metrics.add_collector(collect_component_metrics)
+
+@app.before_request
+def start_request_metrics():
+    g.request_started = time.perf_counter()
+    metrics.add_gauge('ai_http_requests_in_flight', 1, 'Requests being handled')
+
+@app.after_request
+def record_request_metrics(response):
+    # Streamed responses are timed until the handler returns, not until the body is sent
+    route = request.url_rule.rule if request.url_rule else 'unmatched'
+    metrics.observe(
+        'ai_http_request_duration_seconds', time.perf_counter() - g.request_started,
+        'Request latency by route', route=route, method=request.method
+    )
+    metrics.inc(
+        'ai_http_requests_total', 'Requests by route and status',
+        route=route, method=request.method, status=response.status_code
+    )
+    if response.status_code >= 500:
+        metrics.inc('ai_http_request_errors_total', 'Requests answered with a 5xx status', route=route, method=request.method)
+    return response
+
+@app.teardown_request
+def end_request_metrics(exc):
+    if 'request_started' in g:
+        metrics.add_gauge('ai_http_requests_in_flight', -1, 'Requests being handled')
+
+@app.before_request
+def start_request_profile():
+    if request.path.startswith('/api/admin/profiles'):
+        return
+    # Asking for a profile needs the admin token, as profiling slows the request down
+    requested = request.headers.get('X-Profile', '').lower() in ('1', 'true') and check_admin_token() is None
+    g.profile = profiler.start(requested=requested)
+
+def finish_request_profile(status: int):
+    profile = g.pop('profile', None)
+    if profile is None:
+        return None
+    return profiler.stop(
+        profile,
+        route=request.url_rule.rule if request.url_rule else 'unmatched',
+        method=request.method,
+        path=request.full_path if request.query_string else request.path,
+        status=status
+    )
+
+@app.after_request
+def record_request_profile(response):
+    summary = finish_request_profile(response.status_code)
+    if summary:
+        response.headers['X-Profile-Id'] = summary['id']
+    return response
+
+@app.teardown_request
+def end_request_profile(exc):
+    # Only still running when the request failed before after_request
+    finish_request_profile(500)
+
+@app.errorhandler(ComponentError)
+def component_unavailable(e):
+    # Routes fetch components before their try blocks, so build failures land here
+    return jsonify({'error': str(e)}), 500
+
+@app.route('/api/metrics', methods=['GET'])
+def get_metrics():
+    """Expose request, component, cache and queue metrics in the Prometheus text format."""
+    return Response(metrics.render(), mimetype='text/plain; version=0.0.4')
 
 @app.route('/api/recommend', methods=['GET'])
 def get_recommendations():
     """Get product recommendations."""
+    recommender = components.get('recommender')
     try:
         product_id = request.args.get('product_id')
-        print(f"Received recommendation request for product_id: {product_id}")
+        request_logger.info("Received recommendation request for product_id: %s", product_id)
         
         if not product_id:
             return jsonify({'error': 'Product ID is required'}), 400
         
+        try:
+            num_recommendations = int(request.args.get('num_recommendations', '3'))
+        except ValueError:
+            return jsonify({'error': 'num_recommendations must be an integer'}), 400
+        if not 1 <= num_recommendations <= 100:
+            return jsonify({'error': 'num_recommendations must be between 1 and 100'}), 400
+        
         if not recommender:
-            print("Error: Recommender not initialized")
+            logger.error("Recommender not initialized")
             return jsonify({'error': 'Recommender not initialized'}), 500
             
-        recommendations = recommender.get_recommendations(product_id)
-        print(f"Generated recommendations: {recommendations}")
+        with component_timer('recommender', 'get_recommendations'):
+            recommendations = recommender.get_recommendations(product_id, num_recommendations)
+        request_logger.info("Generated %d recommendations for product_id %s", len(recommendations), product_id)
+        
+        return jsonify({'recommendations': recommendations})
+    except Exception as e:
+        logger.error("Error generating recommendations: %s", e)
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/recommend/batch', methods=['POST'])
+def get_batch_recommendations():
+    """Get recommendations for many products, or for a basket of products, in one request."""
+    recommender = components.get('recommender')
+    try:
+        data = request.get_json()
+        if not data or not isinstance(data.get('product_ids'), list) or not data['product_ids']:
+            return jsonify({'error': 'Product IDs are required'}), 400
+        
+        product_ids = [str(pid) for pid in data['product_ids']]
+        if len(product_ids) > 200:
+            return jsonify({'error': 'At most 200 product IDs are allowed'}), 400
+        
+        try:
+            num_recommendations = int(data.get('num_recommendations', 3))
+        except (TypeError, ValueError):
+            return jsonify({'error': 'num_recommendations must be an integer'}), 400
+        if not 1 <= num_recommendations <= 100:
+            return jsonify({'error': 'num_recommendations must be between 1 and 100'}), 400
+        
+        if not recommender:
+            return jsonify({'error': 'Recommender not initialized'}), 500
+        
+        if data.get('basket'):
+            with component_timer('recommender', 'get_basket_recommendations'):
+                recommendations = recommender.get_basket_recommendations(product_ids, num_recommendations)
+        else:
+            with component_timer('recommender', 'get_batch_recommendations'):
+                recommendations = recommender.get_batch_recommendations(product_ids, num_recommendations)
         
         return jsonify({'recommendations': recommendations})
     except Exception as e:
-        print(f"Error generating recommendations: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+def check_admin_token():
+    """
+    Return an error response unless the request carries ADMIN_API_TOKEN.
+
+    Admin routes are disabled (404) while no token is configured.
+    """
+    admin_token = os.environ.get('ADMIN_API_TOKEN')
+    if not admin_token:
+        return jsonify({'error': 'Not found'}), 404
+    if not hmac.compare_digest(request.headers.get('X-Admin-Token', ''), admin_token):
+        return jsonify({'error': 'Unauthorized'}), 401
+    return None
+
+# Fields the recommender builds a product's features from
+PRODUCT_FIELDS = ('name', 'description', 'category', 'brand')
+
+def invalid_product(product, fields: tuple = PRODUCT_FIELDS) -> str:
+    """Return why a product payload cannot be indexed, or an empty string if it can."""
+    if not isinstance(product, dict):
+        return 'Each product must be an object'
+    missing = [field for field in fields if field not in product]
+    if missing:
+        return f"Product is missing required fields: {', '.join(missing)}"
+    return ''
+
+@app.route('/api/admin/products', methods=['POST'])
+def add_products():
+    """Add products to the recommender without a full refit."""
+    recommender = components.get('recommender')
+    try:
+        error = check_admin_token()
+        if error:
+            return error
+        
+        data = request.get_json()
+        if not data or not isinstance(data.get('products'), list):
+            return jsonify({'error': 'Products data is required'}), 400
+        for product in data['products']:
+            reason = invalid_product(product, ('id',) + PRODUCT_FIELDS)
+            if reason:
+                return jsonify({'error': reason}), 400
+        
+        if not recommender:
+            return jsonify({'error': 'Recommender not initialized'}), 500
+        
+        recommender.add_products(data['products'])
+        return jsonify({
+            'total_products': len(recommender.product_ids),
+            'vocabulary_drift': round(recommender.get_vocabulary_drift(), 4)
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/admin/products/<product_id>', methods=['PUT'])
+def update_product(product_id):
+    """Update a product in the recommender."""
+    recommender = components.get('recommender')
+    try:
+        error = check_admin_token()
+        if error:
+            return error
+        
+        data = request.get_json()
+        if not data or 'product' not in data:
+            return jsonify({'error': 'Product data is required'}), 400
+        reason = invalid_product(data['product'])
+        if reason:
+            return jsonify({'error': reason}), 400
+        
+        if not recommender:
+            return jsonify({'error': 'Recommender not initialized'}), 500
+        
+        recommender.update_product({**data['product'], 'id': product_id})
+        return jsonify({
+            'total_products': len(recommender.product_ids),
+            'vocabulary_drift': round(recommender.get_vocabulary_drift(), 4)
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/admin/products/<product_id>', methods=['DELETE'])
+def remove_product(product_id):
+    """Remove a product from the recommender."""
+    recommender = components.get('recommender')
+    try:
+        error = check_admin_token()
+        if error:
+            return error
+        
+        if not recommender:
+            return jsonify({'error': 'Recommender not initialized'}), 500
+        
+        if product_id not in recommender.product_indices:
+            return jsonify({'error': 'Product not found'}), 404
+        
+        recommender.remove_products([product_id])
+        return jsonify({'total_products': len(recommender.product_ids)})
+    except Exception as e:
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/faq', methods=['GET'])
 def get_faq_answer():
     """Get answer for a FAQ question."""
+    faq_bot = components.get('faq_bot')
     try:
         question = request.args.get('question')
         language = request.args.get('language', 'en')
@@ -89,14 +402,47 @@ def get_faq_answer():
         if not question:
             return jsonify({'error': 'Question is required'}), 400
         
-        answer = faq_bot.get_answer(question, language)
+        top_k = request.args.get('top_k')
+        if top_k is not None:
+            try:
+                top_k = int(top_k)
+            except ValueError:
+                return jsonify({'error': 'top_k must be an integer'}), 400
+            if not 1 <= top_k <= 20:
+                return jsonify({'error': 'top_k must be between 1 and 20'}), 400
+            with component_timer('faq_bot', 'get_answers'):
+                answers = faq_bot.get_answers(question, language, top_k)
+            return jsonify({'answers': answers})
+        
+        with component_timer('faq_bot', 'get_answer'):
+            answer = faq_bot.get_answer(question, language)
         return jsonify(answer if answer else {'error': 'No answer found'})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/faq/cache-stats', methods=['GET'])
+def get_faq_cache_stats():
+    """Get FAQ answer cache counters for monitoring."""
+    faq_bot = components.get('faq_bot')
+    return jsonify(faq_bot.get_cache_stats())
+
+def invalid_image_options(image_optimizer, options: Dict[str, Any]) -> str:
+    """
+    Upper-case options['format'] and check it and options['profile'].
+
+    Returns why the options are invalid, or an empty string if they are valid.
+    """
+    options['format'] = str(options['format']).upper()
+    if options['format'] not in image_optimizer.supported_formats:
+        return f"format must be one of {image_optimizer.get_supported_formats()}"
+    if options['profile'] and options['profile'] not in image_optimizer.profiles:
+        return f"profile must be one of {image_optimizer.get_profiles()}"
+    return ''
+
 @app.route('/api/optimize-image', methods=['POST'])
 def optimize_image():
     """Optimize an uploaded image."""
+    image_optimizer = components.get('image_optimizer')
     try:
         if 'image' not in request.files:
             return jsonify({'error': 'No image file provided'}), 400
@@ -106,22 +452,291 @@ def optimize_image():
         
         format = request.form.get('format', 'WEBP')
         quality = int(request.form.get('quality', '85'))
+        profile = request.form.get('profile')
+        target_kb = float(request.form['target_kb']) if request.form.get('target_kb') else None
+        options = {'quality': quality, 'format': format, 'profile': profile, 'target_kb': target_kb}
         
-        result = image_optimizer.optimize_image(
-            image_data,
-            quality=quality,
-            format=format
-        )
+        # async=true queues the work on the process pool and returns a job to poll
+        if request.form.get('async', 'false').lower() == 'true':
+            # Checked up front, since a queued job would only fail once it ran
+            reason = invalid_image_options(image_optimizer, options)
+            if reason:
+                return jsonify({'error': reason}), 400
+            image_jobs = components.get('image_jobs')
+            try:
+                job_id = image_jobs.submit(image_data, **options)
+            except QueueFullError as e:
+                return jsonify({'error': str(e)}), 503
+            return jsonify({
+                'job_id': job_id,
+                'status': 'pending',
+                'status_url': url_for('get_image_job', job_id=job_id)
+            }), 202
+        
+        with component_timer('image_optimizer', 'optimize_image'):
+            result = image_optimizer.optimize_image(image_data, **options)
         
         # Remove binary data from response
         response_data = {k: v for k, v in result.items() if k != 'data'}
+        if 'cache_key' in response_data:
+            response_data['url'] = url_for('get_cached_image', key=response_data['cache_key'])
         return jsonify(response_data)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/optimize-image/variants', methods=['POST'])
+def generate_image_variants():
+    """Generate responsive size/format variants of an uploaded image."""
+    image_optimizer = components.get('image_optimizer')
+    try:
+        if 'image' not in request.files:
+            return jsonify({'error': 'No image file provided'}), 400
+        
+        image_data = request.files['image'].read()
+        widths = [int(w) for w in request.form.get('widths', '200,400,800,1600').split(',')]
+        formats = request.form.get('formats', 'WEBP,JPEG').split(',')
+        quality = int(request.form.get('quality', '85'))
+        include_data = request.form.get('include_data', 'false').lower() == 'true'
+        
+        with component_timer('image_optimizer', 'generate_variants'):
+            result = image_optimizer.generate_variants(
+                image_data,
+                widths=widths,
+                formats=formats,
+                quality=quality,
+                profile=request.form.get('profile')
+            )
+        
+        for variant in result['variants']:
+            data = variant.pop('data')
+            # Binary data is only returned (base64-encoded) when asked for
+            if include_data:
+                variant['data'] = base64.b64encode(data).decode('ascii')
+        return jsonify(result)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+# Archive members larger than this are reported as errors instead of being extracted
+MAX_ARCHIVE_MEMBER_BYTES = 50 * 1024 * 1024
+
+def take_uploads(field: str) -> list:
+    """
+    Detach the spooled upload streams of a form field from the request.
+
+    Flask closes request files as soon as the view returns, but streamed
+    responses keep reading them afterwards; the caller now owns the streams.
+    """
+    uploads = []
+    for upload in request.files.getlist(field):
+        uploads.append((upload.filename, upload.stream))
+        upload.stream = io.BytesIO()
+    return uploads
+
+def iter_uploaded_images(images: list, archives: list):
+    """
+    Yield (name, bytes) for every uploaded image, one at a time.
+
+    images are plain image uploads; archives are .zip or .tar (optionally
+    compressed) uploads. Werkzeug spools large uploads to disk, so only the
+    image currently being read is held in memory. Archive members over
+    MAX_ARCHIVE_MEMBER_BYTES are yielded with None instead of their bytes.
+    """
+    for name, stream in images:
+        yield name, stream.read()
+    
+    for archive_name, stream in archives:
+        if archive_name.lower().endswith('.zip'):
+            with zipfile.ZipFile(stream) as zf:
+                for info in zf.infolist():
+                    if info.is_dir():
+                        continue
+                    if info.file_size > MAX_ARCHIVE_MEMBER_BYTES:
+                        yield info.filename, None
+                        continue
+                    yield info.filename, zf.read(info)
+        else:
+            # Stream mode reads members sequentially without seeking
+            with tarfile.open(fileobj=stream, mode='r|*') as tf:
+                for member in tf:
+                    if not member.isfile():
+                        continue
+                    if member.size > MAX_ARCHIVE_MEMBER_BYTES:
+                        yield member.name, None
+                        continue
+                    yield member.name, tf.extractfile(member).read()
+
+class ChunkWriter:
+    """Write-only file object collecting chunks, for streaming a zip as it is built."""
+    def __init__(self):
+        self.chunks = []
+
+    def write(self, data: bytes) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b''.join(self.chunks)
+        self.chunks = []
+        return data
+
+@app.route('/api/optimize-image/batch', methods=['POST'])
+def optimize_image_batch():
+    """
+    Optimize many uploaded images in one request.
+
+    Images are fanned out across the job queue's worker processes. Results
+    stream back as NDJSON (one line per image, in upload order) or, with
+    output=zip, as a zip of optimized images plus a manifest.json.
+    """
+    image_optimizer = components.get('image_optimizer')
+    image_jobs = components.get('image_jobs')
+    if not request.files.getlist('images') and 'archive' not in request.files:
+        return jsonify({'error': 'No image files or archive provided'}), 400
+    
+    try:
+        options = {
+            'format': request.form.get('format', 'WEBP'),
+            'quality': int(request.form.get('quality', '85')),
+            'profile': request.form.get('profile'),
+            'target_kb': float(request.form['target_kb']) if request.form.get('target_kb') else None
+        }
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    # Checked up front, since errors inside the stream arrive after the 200 headers
+    reason = invalid_image_options(image_optimizer, options)
+    if reason:
+        return jsonify({'error': reason}), 400
+    output = request.form.get('output', 'ndjson')
+    if output not in ('ndjson', 'zip'):
+        return jsonify({'error': "output must be 'ndjson' or 'zip'"}), 400
+    
+    images = take_uploads('images')
+    archives = take_uploads('archive')
+    
+    def optimized():
+        # Oversized archive members are reported without being sent to a worker
+        oversized = []
+        def inputs():
+            for name, image_data in iter_uploaded_images(images, archives):
+                if image_data is None:
+                    oversized.append(name)
+                else:
+                    yield name, image_data
+        
+        try:
+            for name, outcome in image_jobs.optimize_many(inputs(), **options):
+                while oversized:
+                    yield oversized.pop(0), {'error': 'Archive member is too large'}
+                yield name, outcome
+            while oversized:
+                yield oversized.pop(0), {'error': 'Archive member is too large'}
+        finally:
+            for _, stream in images + archives:
+                stream.close()
+    
+    def entry(name, outcome):
+        if 'error' in outcome:
+            return {'name': name, 'error': outcome['error']}
+        result = outcome['result']
+        item = {'name': name, **{k: v for k, v in result.items() if k != 'data'}}
+        item['run_seconds'] = round(outcome['finished_at'] - outcome['started_at'], 4)
+        return item
+    
+    def ndjson():
+        for name, outcome in optimized():
+            yield json.dumps(entry(name, outcome)) + '\n'
+    
+    def zipped():
+        writer = ChunkWriter()
+        manifest = []
+        extension = image_optimizer.supported_formats[options['format']]
+        used = {'manifest.json'}
+        with zipfile.ZipFile(writer, 'w', compression=zipfile.ZIP_STORED) as zf:
+            for name, outcome in optimized():
+                item = entry(name, outcome)
+                if 'error' not in item:
+                    # a.jpg and a.png both become a.<ext>; later ones get a numbered suffix
+                    base = os.path.splitext(name)[0]
+                    item['file'] = f"{base}.{extension}"
+                    suffix = 1
+                    while item['file'] in used:
+                        item['file'] = f"{base}-{suffix}.{extension}"
+                        suffix += 1
+                    used.add(item['file'])
+                    zf.writestr(item['file'], outcome['result']['data'])
+                manifest.append(item)
+                yield writer.drain()
+            zf.writestr('manifest.json', json.dumps(manifest, indent=2))
+        yield writer.drain()
+    
+    if output == 'zip':
+        return Response(
+            zipped(),
+            mimetype='application/zip',
+            headers={'Content-Disposition': 'attachment; filename=optimized-images.zip'}
+        )
+    return Response(ndjson(), mimetype='application/x-ndjson')
+
+@app.route('/api/optimize-image/<job_id>', methods=['GET'])
+def get_image_job(job_id):
+    """Get the status of an image optimization job, or its output with ?download=true."""
+    image_jobs = components.get('image_jobs')
+    job = image_jobs.get_job(job_id)
+    if job is None:
+        return jsonify({'error': 'Job not found'}), 404
+    
+    result = job.pop('result', None)
+    if request.args.get('download', 'false').lower() == 'true':
+        if result is None:
+            return jsonify({'error': f"Job is {job['status']}"}), 409
+        return Response(result['data'], mimetype=f"image/{result['format']}")
+    
+    if result is not None:
+        # Remove binary data from response
+        job['result'] = {k: v for k, v in result.items() if k != 'data'}
+        if 'cache_key' in result:
+            job['result']['url'] = url_for('get_cached_image', key=result['cache_key'])
+    return jsonify(job)
+
+@app.route('/api/images/<key>', methods=['GET'])
+def get_cached_image(key):
+    """Serve an optimized image from the content-addressed cache."""
+    image_optimizer = components.get('image_optimizer')
+    if image_optimizer.cache is None:
+        return jsonify({'error': 'Image cache is not enabled'}), 404
+    if len(key) != 64 or any(c not in '0123456789abcdef' for c in key):
+        return jsonify({'error': 'Invalid image key'}), 400
+    
+    cached = image_optimizer.cache.get(key)
+    if cached is None:
+        return jsonify({'error': 'Image not found'}), 404
+    
+    data, metadata = cached
+    response = Response(data, mimetype=f"image/{metadata['format']}")
+    # The key is a content hash, so the bytes behind a URL never change
+    response.set_etag(key)
+    response.cache_control.public = True
+    response.cache_control.max_age = 31536000
+    response.cache_control.immutable = True
+    return response.make_conditional(request)
+
+@app.route('/api/optimize-image/queue', methods=['GET'])
+def get_image_queue_stats():
+    """Get image job queue depth and counters."""
+    image_jobs = components.get('image_jobs')
+    return jsonify(image_jobs.get_stats())
+
 @app.route('/api/generate-seo', methods=['POST'])
 def generate_seo():
     """Generate SEO metadata for a product."""
+    seo_generator = components.get('seo_generator')
     try:
         data = request.get_json()
         if not data or 'product' not in data:
@@ -130,18 +745,66 @@ def generate_seo():
         language = data.get('language', 'en')
         template_type = data.get('template_type', 'default')
         
-        seo_data = seo_generator.generate_seo(
-            data['product'],
-            language=language,
-            template_type=template_type
-        )
+        with component_timer('seo_generator', 'generate_seo'):
+            seo_data = seo_generator.generate_seo(
+                data['product'],
+                language=language,
+                template_type=template_type
+            )
         return jsonify(seo_data)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/generate-seo/cache-stats', methods=['GET'])
+def get_seo_cache_stats():
+    """Get SEO result cache counters for monitoring."""
+    seo_generator = components.get('seo_generator')
+    return jsonify(seo_generator.get_cache_stats())
+
+# Larger batches should use source 'catalog' or build_seo_export.py
+MAX_SEO_BATCH_PRODUCTS = 10000
+
+@app.route('/api/generate-seo/batch', methods=['POST'])
+def generate_seo_batch():
+    """
+    Generate SEO metadata for many products, streamed as NDJSON.
+
+    Takes a 'products' list, or 'source': 'catalog' to use products.json.
+    Each line is {"id": ..., "seo": {...}} in input order.
+    """
+    seo_generator = components.get('seo_generator')
+    data = request.get_json(silent=True)
+    if not data or ('products' not in data and data.get('source') != 'catalog'):
+        return jsonify({'error': "Products list or source 'catalog' is required"}), 400
+    
+    language = data.get('language', 'en')
+    template_type = data.get('template_type', 'default')
+    if language not in seo_generator.get_supported_languages():
+        return jsonify({'error': f'Unsupported language: {language}'}), 400
+    if template_type not in seo_generator.get_template_types():
+        return jsonify({'error': f'Unknown template type: {template_type}'}), 400
+    
+    if 'products' in data:
+        # Checked up front, since errors inside the stream arrive after the 200 headers
+        products = data['products']
+        if not isinstance(products, list) or not all(isinstance(p, dict) for p in products):
+            return jsonify({'error': 'products must be a list of product objects'}), 400
+        if len(products) > MAX_SEO_BATCH_PRODUCTS:
+            return jsonify({'error': f'At most {MAX_SEO_BATCH_PRODUCTS} products are allowed'}), 400
+    else:
+        products = list(iter_catalog())
+    
+    def ndjson():
+        results = seo_generator.generate_seo_batch(products, language=language, template_type=template_type)
+        for product, seo_data in zip(products, results):
+            yield json.dumps({'id': product.get('id'), 'seo': seo_data}, ensure_ascii=False) + '\n'
+    
+    return Response(ndjson(), mimetype='application/x-ndjson')
+
 @app.route('/api/analyze-reviews', methods=['POST'])
 def analyze_reviews():
     """Analyze product reviews."""
+    review_analyzer = components.get('review_analyzer')
     try:
         data = request.get_json()
         if not data or 'reviews' not in data:
@@ -149,10 +812,11 @@ def analyze_reviews():
         
         language = data.get('language', 'en')
         
-        analysis = review_analyzer.analyze_reviews(
-            data['reviews'],
-            language=language
-        )
+        with component_timer('review_analyzer', 'analyze_reviews'):
+            analysis = review_analyzer.analyze_reviews(
+                data['reviews'],
+                language=language
+            )
         
         summary = review_analyzer.generate_summary(
             analysis,
@@ -166,18 +830,149 @@ def analyze_reviews():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/analyze-reviews/bulk', methods=['POST'])
+def analyze_reviews_bulk():
+    """
+    Analyze a large review corpus sent as NDJSON, one review object per line.
+
+    The body is read as it is parsed and analyzed in chunks on the review
+    analyzer's process pool, so the corpus is never held in memory at once.
+    """
+    review_analyzer = components.get('review_analyzer')
+    language = request.args.get('language', 'en')
+    if language not in ('en', 'hi'):
+        return jsonify({'error': f'Unsupported language: {language}'}), 400
+    
+    def reviews():
+        for line in request.stream:
+            if line.strip():
+                review = json.loads(line)
+                if not isinstance(review, dict):
+                    raise ValueError('each line must be a JSON object')
+                yield review
+    
+    try:
+        with component_timer('review_analyzer', 'analyze_reviews_parallel'):
+            analysis = review_analyzer.analyze_reviews_parallel(reviews(), language=language)
+        summary = review_analyzer.generate_summary(analysis, language=language)
+        return jsonify({
+            'analysis': analysis,
+            'summary': summary
+        })
+    except (ValueError, KeyError) as e:
+        return jsonify({'error': f'Invalid review line: {e}'}), 400
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+def invalid_reviews(reviews) -> str:
+    """Return why a reviews payload cannot be stored, or an empty string if it can."""
+    if not isinstance(reviews, list):
+        return 'reviews must be a list'
+    for review in reviews:
+        if not isinstance(review, dict) or not isinstance(review.get('text'), str):
+            return "Each review must be an object with a 'text' string"
+        rating = review.get('rating')
+        if rating is not None and (isinstance(rating, bool) or not isinstance(rating, (int, float))):
+            return 'rating must be a number'
+    return ''
+
+@app.route('/api/products/<product_id>/reviews', methods=['POST'])
+def add_product_reviews(product_id):
+    """
+    Add new reviews to a product's stored aggregate and return its updated analysis.
+
+    Stored aggregates are permanent, so this needs the admin token.
+    """
+    review_analyzer = components.get('review_analyzer')
+    review_store = components.get('review_store')
+    try:
+        error = check_admin_token()
+        if error:
+            return error
+        
+        data = request.get_json(silent=True)
+        if not data or 'reviews' not in data:
+            return jsonify({'error': 'Reviews data is required'}), 400
+        reason = invalid_reviews(data['reviews'])
+        if reason:
+            return jsonify({'error': reason}), 400
+        
+        language = data.get('language', 'en')
+        if language not in ('en', 'hi'):
+            return jsonify({'error': f'Unsupported language: {language}'}), 400
+        with component_timer('review_store', 'add_reviews'):
+            review_store.add_reviews(product_id, data['reviews'], language=language)
+        with component_timer('review_store', 'get_analysis'):
+            analysis = review_store.get_analysis(product_id, language=language)
+        
+        return jsonify({
+            'analysis': analysis,
+            'summary': review_analyzer.generate_summary(analysis, language=language)
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/products/<product_id>/reviews/summary', methods=['GET'])
+def get_product_review_summary(product_id):
+    """Get a product's review analysis from its stored aggregate."""
+    review_analyzer = components.get('review_analyzer')
+    review_store = components.get('review_store')
+    try:
+        language = request.args.get('language', 'en')
+        with component_timer('review_store', 'get_analysis'):
+            analysis = review_store.get_analysis(product_id, language=language)
+        
+        return jsonify({
+            'analysis': analysis,
+            'summary': review_analyzer.generate_summary(analysis, language=language)
+        })
+    except Exception as e:
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/admin/profiles', methods=['GET'])
+def list_profiles():
+    """List the stored request profiles, newest first."""
+    error = check_admin_token()
+    if error:
+        return error
+    return jsonify({
+        'enabled': profiler.enabled,
+        'sample_rate': profiler.sample_rate,
+        'profiles': profiler.list_profiles()
+    })
+
+@app.route('/api/admin/profiles/<profile_id>', methods=['GET'])
+def get_profile(profile_id):
+    """Get a stored profile as a text report, or as a .prof file with ?format=pstats."""
+    error = check_admin_token()
+    if error:
+        return error
+    profile = profiler.get_profile(profile_id)
+    if profile is None:
+        return jsonify({'error': 'Profile not found'}), 404
+    
+    if request.args.get('format') == 'pstats':
+        return Response(
+            profile['pstats'],
+            mimetype='application/octet-stream',
+            headers={'Content-Disposition': f'attachment; filename={profile_id}.prof'}
+        )
+    return Response(profile['report'], mimetype='text/plain')
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
-    """Health check endpoint."""
+    """
+    Health check endpoint.
+
+    Reports, per component, whether it has been built yet and how long its
+    import and initialization took. Checking health never builds anything.
+    """
+    services = components.get_status()
+    if components.is_initialized('recommender'):
+        services['recommender']['available'] = components.get('recommender') is not None
     return jsonify({
         'status': 'healthy',
-        'services': {
-            'recommender': recommender is not None,
-            'faq_bot': True,
-            'image_optimizer': True,
-            'seo_generator': True,
-            'review_analyzer': True
-        }
+        'services': services
     })
 
 if __name__ == '__main__':
@@ -0,0 +1,127 @@
+from typing import Any, Callable, Dict, Iterable, Optional
+import importlib
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+class ComponentError(Exception):
+    """Raised when a component failed to build; the build error is kept as __cause__."""
+
+class ComponentRegistry:
+    def __init__(self, package: Optional[str] = None, retry_interval: float = 30.0):
+        """
+        Lazily imported and built AI components.
+
+        Each component names the module it needs and a builder taking that
+        module. Nothing is imported or built until the component is first
+        requested, so processes only pay for the endpoints they serve. A
+        failed build is remembered and re-raised for retry_interval seconds
+        before it is attempted again, so a broken component does not rebuild
+        on every request.
+
+        Args:
+            package: Package used to resolve relative module names
+            retry_interval: Seconds before a failed build is retried
+        """
+        self.package = package
+        self.retry_interval = retry_interval
+        self._failures = {}
+        self._specs = {}
+        self._instances = {}
+        self._status = {}
+        self._locks = {}
+        self._lock = threading.Lock()
+
+    def register(self, name: str, builder: Callable[[Any], Any], module: Optional[str] = None) -> None:
+        """
+        Register a component.
+
+        Args:
+            name: Component name
+            builder: Called with the imported module (or None) to build the component
+            module: Module imported right before the first build
+        """
+        with self._lock:
+            self._specs[name] = (module, builder)
+            self._status[name] = {'initialized': False}
+            # Per-component locks, so a slow build does not hold up the others
+            self._locks[name] = threading.Lock()
+
+    def get(self, name: str) -> Any:
+        """
+        Get a component, importing and building it on first use.
+
+        Raises:
+            ComponentError: If the component failed to build within the last retry_interval seconds
+        """
+        if name in self._instances:
+            return self._instances[name]
+
+        with self._locks[name]:
+            # Another thread may have built it while we waited
+            if name in self._instances:
+                return self._instances[name]
+
+            failure = self._failures.get(name)
+            if failure is not None and time.monotonic() - failure[0] < self.retry_interval:
+                raise ComponentError(f"{name} is unavailable: {failure[1]}") from failure[1]
+
+            module_name, builder = self._specs[name]
+            status = self._status[name]
+            try:
+                start = time.perf_counter()
+                module = importlib.import_module(module_name, self.package) if module_name else None
+                imported = time.perf_counter()
+                instance = builder(module)
+            except Exception as e:
+                logger.error("Error initializing %s: %s", name, e)
+                status['error'] = str(e)
+                self._failures[name] = (time.monotonic(), e)
+                raise ComponentError(f"{name} is unavailable: {e}") from e
+            self._failures.pop(name, None)
+            status.update({
+                'initialized': True,
+                'import_seconds': round(imported - start, 4),
+                'init_seconds': round(time.perf_counter() - imported, 4),
+                'error': None
+            })
+            self._instances[name] = instance
+            return instance
+
+    def is_initialized(self, name: str) -> bool:
+        return name in self._instances
+
+    def warmup(self, names: Optional[Iterable[str]] = None) -> Dict[str, Any]:
+        """
+        Build components ahead of the first request.
+
+        Args:
+            names: Components to build, all registered components by default
+
+        Returns:
+            Status of every registered component
+        """
+        for name in names or list(self._specs):
+            try:
+                self.get(name)
+            except ComponentError:
+                # Already logged and recorded in the status
+                pass
+        return self.get_status()
+
+    def get_status(self) -> Dict[str, Any]:
+        """Get whether each component is built and its import and init timings."""
+        with self._lock:
+            return {name: dict(status) for name, status in self._status.items()}
+
+    def shutdown(self) -> None:
+        """Shut down built components that own worker processes or threads."""
+        for instance in list(self._instances.values()):
+            if hasattr(instance, 'shutdown'):
+                instance.shutdown()
+
+def create_component_registry(package: Optional[str] = None, retry_interval: float = 30.0) -> ComponentRegistry:
+    """Helper function to create a component registry instance."""
+    return ComponentRegistry(package=package, retry_interval=retry_interval)
@@ -1,8 +1,37 @@
 from fuzzywuzzy import fuzz
-from typing import Dict, Optional, List
+from sklearn.feature_extraction.text import TfidfVectorizer
+from collections import Counter
+from typing import Any, Dict, Iterator, Optional, List
+from .cache import LRUCache
+import numpy as np
+import heapq
+import pickle
+import json
+
+# Bump whenever the layout written by FAQBot.save_compiled changes
+COMPILED_FORMAT_VERSION = 1
 
 class FAQBot:
-    def __init__(self):
+    def __init__(
+        self,
+        max_candidates: Optional[int] = 50,
+        engine: str = "fuzzy",
+        min_similarity: float = 0.3,
+        cache_size: int = 1024,
+        cache_ttl: Optional[float] = 3600
+    ):
+        if engine not in self.get_engines():
+            raise ValueError(f"Unknown FAQ engine '{engine}', expected one of {self.get_engines()}")
+
+        # "fuzzy" scores string ratios, "tfidf" ranks by char n-gram TF-IDF cosine similarity
+        self.engine = engine
+        # Number of index candidates that get full fuzzy scoring; None scores every variant
+        self.max_candidates = max_candidates
+        # Minimum cosine similarity for the tfidf engine to return an answer
+        self.min_similarity = min_similarity
+        # Answers keyed by (normalized question, language, top_k); cleared whenever FAQs change
+        self.answer_cache = LRUCache(max_size=cache_size, ttl=cache_ttl)
+
         # Initialize with common baby product FAQs in English and Hindi
         self.faqs = {
             "diaper_change": {
@@ -84,58 +113,258 @@ class FAQBot:
             }
         }
 
-    def get_answer(self, question: str, language: str = "en") -> Optional[Dict[str, str]]:
-        """Get answer for a question in specified language."""
-        best_match = None
-        highest_score = 0
+        self._build_index()
 
-        # Clean and normalize the input question
-        clean_question = question.lower().strip().replace('?', '')
+    def _normalize(self, text: str) -> str:
+        """Clean and normalize a question for matching."""
+        return ' '.join(text.lower().replace('?', '').split())
 
+    def _ngrams(self, text: str) -> set:
+        """Character n-grams (1 to 3 characters) of a normalized question."""
+        return {text[i:i + n] for n in (1, 2, 3) for i in range(len(text) - n + 1)}
+
+    def _build_index(self) -> None:
+        """Precompute normalized question variants and an n-gram inverted index per language."""
+        # entries[language] is a list of (faq_id, question, normalized question) in FAQ order
+        self._entries = {}
+        # ngram_index[language] maps a character n-gram to the sorted entry positions containing it
+        self._ngram_index = {}
+        # semantic_index[language] is a fitted (vectorizer, matrix) pair, built lazily for the tfidf engine
+        self._semantic_index = {}
+        self.answer_cache.clear()
         for faq_id, faq in self.faqs.items():
-            # Check each question variant
-            for q in faq["questions"][language]:
-                # Clean and normalize the FAQ question
-                clean_q = q.lower().strip().replace('?', '')
-                
-                # Try different matching methods
-                ratio = fuzz.ratio(clean_question, clean_q)
-                partial_ratio = fuzz.partial_ratio(clean_question, clean_q)
-                token_sort_ratio = fuzz.token_sort_ratio(clean_question, clean_q)
-                
-                # Use the highest score from any method
-                score = max(ratio, partial_ratio, token_sort_ratio)
-                
-                if score > highest_score and score > 60:  # Lower threshold to 60%
-                    highest_score = score
-                    best_match = {
-                        "question": q,
-                        "answer": faq["answer"][language],
-                        "confidence": score
-                    }
+            self._index_faq(faq_id, faq)
+
+    def _index_faq(self, faq_id: str, faq: Dict) -> None:
+        """Append the question variants of one FAQ to the index."""
+        for language, questions in faq["questions"].items():
+            # IDF weights depend on every variant, so the TF-IDF index is refitted on next use
+            self._semantic_index.pop(language, None)
+            self.answer_cache.clear()
+            entries = self._entries.setdefault(language, [])
+            ngram_index = self._ngram_index.setdefault(language, {})
+            for q in questions:
+                clean_q = self._normalize(q)
+                position = len(entries)
+                entries.append((faq_id, q, clean_q))
+                for gram in self._ngrams(clean_q):
+                    ngram_index.setdefault(gram, []).append(position)
+
+    def _candidates(self, clean_question: str, language: str) -> List[int]:
+        """Entry positions worth fuzzy scoring, pruned by trigram overlap with the question."""
+        entries = self._entries[language]
+        if self.max_candidates is None or len(entries) <= self.max_candidates:
+            return list(range(len(entries)))
+
+        ngram_index = self._ngram_index[language]
+        overlap = Counter()
+        trigrams = {clean_question[i:i + 3] for i in range(len(clean_question) - 2)} or {clean_question}
+        for gram in trigrams:
+            overlap.update(ngram_index.get(gram, ()))
+
+        top = heapq.nlargest(self.max_candidates, overlap.items(), key=lambda item: item[1])
+        return sorted(position for position, _ in top)
+
+    def _keyword_match(self, clean_question: str, language: str) -> Optional[int]:
+        """First entry (in FAQ order) containing any word of the question as a substring."""
+        entries = self._entries[language]
+        ngram_index = self._ngram_index[language]
+        best = None
+        for keyword in set(clean_question.split()):
+            if len(keyword) <= 3:
+                candidates = ngram_index.get(keyword, ())
+            else:
+                # A substring match requires every trigram of the keyword to be present
+                postings = [ngram_index.get(keyword[i:i + 3], ()) for i in range(len(keyword) - 2)]
+                candidates = sorted(set.intersection(*map(set, postings)))
+            for position in candidates:
+                if best is not None and position >= best:
+                    break
+                if keyword in entries[position][2]:
+                    best = position
+                    break
+        return best
+
+    def _get_semantic_index(self, language: str) -> tuple:
+        """Fit (once) the char n-gram TF-IDF matrix over all variants of a language."""
+        if language not in self._semantic_index:
+            entries = self._entries[language]
+            vectorizer = TfidfVectorizer(analyzer='char_wb', ngram_range=(2, 4), dtype=np.float32)
+            matrix = vectorizer.fit_transform([clean_q for _, _, clean_q in entries])
+            self._semantic_index[language] = (vectorizer, matrix)
+        return self._semantic_index[language]
+
+    def _fuzzy_matches(self, clean_question: str, language: str) -> List[tuple]:
+        """Best (score, position) per FAQ above the fuzzy threshold, best first."""
+        entries = self._entries[language]
+        best_per_faq = {}
+
+        for position in self._candidates(clean_question, language):
+            faq_id, q, clean_q = entries[position]
+
+            # Try different matching methods
+            ratio = fuzz.ratio(clean_question, clean_q)
+            partial_ratio = fuzz.partial_ratio(clean_question, clean_q)
+            token_sort_ratio = fuzz.token_sort_ratio(clean_question, clean_q)
+
+            # Use the highest score from any method
+            score = max(ratio, partial_ratio, token_sort_ratio)
+
+            if score > 60 and score > best_per_faq.get(faq_id, (0, 0))[0]:  # Lower threshold to 60%
+                best_per_faq[faq_id] = (score, position)
+
+        matches = sorted(best_per_faq.values(), key=lambda match: (-match[0], match[1]))
 
         # If no good match found, try keyword matching
-        if not best_match:
-            keywords = clean_question.split()
-            for faq_id, faq in self.faqs.items():
-                for q in faq["questions"][language]:
-                    clean_q = q.lower().strip().replace('?', '')
-                    # Check if any keywords match
-                    if any(keyword in clean_q for keyword in keywords):
-                        return {
-                            "question": q,
-                            "answer": faq["answer"][language],
-                            "confidence": 60
-                        }
-
-        return best_match
+        if not matches:
+            position = self._keyword_match(clean_question, language)
+            if position is not None:
+                matches = [(60, position)]
+
+        return matches
+
+    def _semantic_matches(self, clean_question: str, language: str, top_k: int) -> List[tuple]:
+        """Top (confidence, position) per FAQ by cosine similarity, best first."""
+        entries = self._entries[language]
+        if not entries:
+            return []
+        vectorizer, matrix = self._get_semantic_index(language)
+
+        # One sparse matrix-vector product scores every variant; rows are L2-normalized
+        scores = (matrix @ vectorizer.transform([clean_question]).T).toarray().ravel()
+
+        # Only variants above the threshold need ranking
+        above = np.flatnonzero(scores >= self.min_similarity)
+        matches = []
+        seen = set()
+        for position in above[np.argsort(-scores[above], kind='stable')]:
+            if len(matches) == top_k:
+                break
+            faq_id = entries[position][0]
+            if faq_id not in seen:
+                seen.add(faq_id)
+                matches.append((int(round(scores[position] * 100)), int(position)))
+        return matches
+
+    def get_answers(self, question: str, language: str = "en", top_k: int = 1) -> List[Dict[str, str]]:
+        """Get up to top_k answers (one per FAQ) for a question, best first."""
+        # Clean and normalize the input question
+        clean_question = self._normalize(question)
+        cache_key = (clean_question, language, top_k)
+        cached = self.answer_cache.get(cache_key)
+        if cached is not None:
+            return [dict(answer) for answer in cached]
+
+        entries = self._entries[language]
+
+        if self.engine == "tfidf":
+            matches = self._semantic_matches(clean_question, language, top_k)
+        else:
+            matches = self._fuzzy_matches(clean_question, language)[:top_k]
+
+        answers = [
+            {
+                "question": entries[position][1],
+                "answer": self.faqs[entries[position][0]]["answer"][language],
+                "confidence": confidence
+            }
+            for confidence, position in matches
+        ]
+        self.answer_cache.set(cache_key, answers)
+        return [dict(answer) for answer in answers]
+
+    def get_answer(self, question: str, language: str = "en") -> Optional[Dict[str, str]]:
+        """Get answer for a question in specified language."""
+        answers = self.get_answers(question, language, top_k=1)
+        return answers[0] if answers else None
 
     def add_faq(self, faq_id: str, questions: Dict[str, List[str]], answers: Dict[str, str]) -> None:
         """Add a new FAQ to the bot."""
+        replaced = faq_id in self.faqs
         self.faqs[faq_id] = {
             "questions": questions,
             "answer": answers
         }
+        if replaced:
+            # Replaced variants keep their FAQ position, so rebuild rather than append
+            self._build_index()
+        else:
+            self._index_faq(faq_id, self.faqs[faq_id])
+
+    def load_faqs(self, path: str) -> int:
+        """
+        Bulk-load FAQs from a JSON or JSONL file.
+
+        Each record is either multilingual,
+        {"id": ..., "questions": {"en": [...]}, "answer": {"en": ...}},
+        or a single language,
+        {"id": ..., "language": "en", "questions": [...], "answer": ...};
+        single-language records with the same id are merged. JSONL files are
+        streamed line by line, and the match index is rebuilt once at the end.
+
+        Returns:
+            Number of records loaded
+        """
+        count = 0
+        for record in self._read_faq_records(path):
+            faq = self.faqs.setdefault(str(record["id"]), {"questions": {}, "answer": {}})
+            if "language" in record:
+                faq["questions"][record["language"]] = list(record["questions"])
+                faq["answer"][record["language"]] = record["answer"]
+            else:
+                faq["questions"].update(record["questions"])
+                faq["answer"].update(record["answer"])
+            count += 1
+
+        self._build_index()
+        return count
+
+    def _read_faq_records(self, path: str) -> Iterator[Dict]:
+        """Yield FAQ records from a JSONL file, a JSON list of records, or a JSON object keyed by id."""
+        with open(path, 'r', encoding='utf-8') as f:
+            if path.endswith('.jsonl'):
+                for line in f:
+                    if line.strip():
+                        yield json.loads(line)
+                return
+
+            data = json.load(f)
+            if isinstance(data, dict):
+                for faq_id, faq in data.items():
+                    yield {"id": faq_id, **faq}
+            else:
+                yield from data
+
+    def save_compiled(self, path: str) -> None:
+        """
+        Save the FAQs with their normalized variants and n-gram index to a binary file.
+
+        load_compiled() restores the bot from it without re-normalizing or
+        re-indexing. The file is a pickle, so only load files you built yourself.
+        """
+        with open(path, 'wb') as f:
+            pickle.dump({
+                "format_version": COMPILED_FORMAT_VERSION,
+                "faqs": self.faqs,
+                "entries": self._entries,
+                "ngram_index": self._ngram_index
+            }, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    def load_compiled(self, path: str) -> None:
+        """Replace the bot's FAQs and match index with a file written by save_compiled()."""
+        with open(path, 'rb') as f:
+            compiled = pickle.load(f)
+        if compiled.get("format_version") != COMPILED_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported compiled FAQ format {compiled.get('format_version')}, "
+                f"expected {COMPILED_FORMAT_VERSION}"
+            )
+
+        self.faqs = compiled["faqs"]
+        self._entries = compiled["entries"]
+        self._ngram_index = compiled["ngram_index"]
+        self._semantic_index = {}
+        self.answer_cache.clear()
 
     def get_all_faqs(self, language: str = "en") -> List[Dict[str, str]]:
         """Get all FAQs in specified language."""
@@ -152,6 +381,25 @@ class FAQBot:
         """Get list of supported languages."""
         return ["en", "hi"]  # English and Hindi
 
-def create_faq_bot() -> FAQBot:
-    """Helper function to create a FAQ bot instance."""
-    return FAQBot()
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get answer cache hit/miss/eviction counters."""
+        return self.answer_cache.get_stats()
+
+    def get_engines(self) -> List[str]:
+        """Get list of available retrieval engines."""
+        return ["fuzzy", "tfidf"]
+
+def create_faq_bot(engine: str = "fuzzy", faq_path: Optional[str] = None) -> FAQBot:
+    """
+    Helper function to create a FAQ bot instance.
+
+    faq_path may point at a compiled file (.faqc) written by save_compiled(),
+    or at a JSON/JSONL file whose FAQs are added to the built-in ones.
+    """
+    bot = FAQBot(engine=engine)
+    if faq_path:
+        if faq_path.endswith('.faqc'):
+            bot.load_compiled(faq_path)
+        else:
+            bot.load_faqs(faq_path)
+    return bot
@@ -0,0 +1,196 @@
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:
+    # Not available on Windows; eviction then only serializes within a process
+    fcntl = None
+
+INDEX_NAME = '.index.json'
+
+class ImageCache:
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 512 * 1024 * 1024,
+        low_water: float = 0.9,
+        rescan_interval: float = 300.0
+    ):
+        """
+        Content-addressed disk cache for optimized images.
+
+        Entries are keyed by a SHA-256 of the input bytes and the optimization
+        parameters, and stored as <key>.bin (encoded image) plus <key>.json
+        (metadata). Total size is bounded by max_bytes with least-recently-used
+        eviction; file modification times record recency across restarts.
+
+        Several processes (pool workers, server workers) may share a
+        directory, so the entry count and total size are kept in a small
+        index file updated under a lock file. The directory is only listed
+        when evicting, which trims down to low_water * max_bytes so it stays
+        rare, and every rescan_interval seconds to correct drift.
+        Hit, miss and eviction counters are per process.
+
+        Args:
+            directory: Cache directory, created if missing
+            max_bytes: Bound on the total size of cached images
+            low_water: Fraction of max_bytes that eviction trims down to
+            rescan_interval: Seconds after which the index is rebuilt from disk
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.low_water = low_water
+        self.rescan_interval = rescan_interval
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        os.makedirs(directory, exist_ok=True)
+        with self._lock, self._directory_lock():
+            if self._read_index() is None:
+                self._write_index(self._scan_index())
+
+    def _scan(self) -> List[Tuple[float, str, int]]:
+        """List (mtime, key, size) of the entries on disk, least recently used first."""
+        found = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.bin'):
+                try:
+                    stat = os.stat(os.path.join(self.directory, name))
+                except FileNotFoundError:
+                    # Evicted by another process since listdir
+                    continue
+                found.append((stat.st_mtime, name[:-4], stat.st_size))
+        return sorted(found)
+
+    def _scan_index(self) -> Dict[str, Any]:
+        found = self._scan()
+        return {'entries': len(found), 'total_bytes': sum(size for _, _, size in found), 'scanned_at': time.time()}
+
+    def _read_index(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(os.path.join(self.directory, INDEX_NAME), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _write_index(self, index: Dict[str, Any]) -> None:
+        self._write_atomic(os.path.join(self.directory, INDEX_NAME), json.dumps(index).encode('utf-8'))
+
+    @contextmanager
+    def _directory_lock(self) -> Iterator[None]:
+        """Hold an exclusive lock on the directory shared with other processes."""
+        if fcntl is None:
+            yield
+            return
+        with open(os.path.join(self.directory, '.lock'), 'a') as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    @staticmethod
+    def make_key(image_data: bytes, **params) -> str:
+        """Hash input bytes together with the parameters that affect the output."""
+        digest = hashlib.sha256(image_data)
+        digest.update(json.dumps(params, sort_keys=True).encode('utf-8'))
+        return digest.hexdigest()
+
+    def _path(self, key: str, extension: str) -> str:
+        return os.path.join(self.directory, f"{key}.{extension}")
+
+    def get(self, key: str) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        """Return (data, metadata) for a cached key, or None on a miss."""
+        try:
+            with open(self._path(key, 'bin'), 'rb') as f:
+                data = f.read()
+            with open(self._path(key, 'json'), 'r', encoding='utf-8') as f:
+                metadata = json.load(f)
+        except (FileNotFoundError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+
+        with self._lock:
+            self.hits += 1
+        try:
+            os.utime(self._path(key, 'bin'))
+        except OSError:
+            pass
+        return data, metadata
+
+    def put(self, key: str, data: bytes, metadata: Dict[str, Any]) -> None:
+        """Store an entry, evicting least recently used entries beyond max_bytes."""
+        try:
+            replaced = os.stat(self._path(key, 'bin')).st_size
+        except FileNotFoundError:
+            replaced = None
+
+        # Write to temporary files and rename, so readers never see partial entries
+        self._write_atomic(self._path(key, 'json'), json.dumps(metadata).encode('utf-8'))
+        self._write_atomic(self._path(key, 'bin'), data)
+        written_at = time.time()
+
+        with self._lock, self._directory_lock():
+            index = self._read_index()
+            if index is None or time.time() - index['scanned_at'] > self.rescan_interval:
+                index = self._scan_index()
+            elif index['scanned_at'] >= written_at:
+                # Another process rescanned after the write, so the entry is already counted
+                pass
+            else:
+                index['total_bytes'] += len(data) - (replaced or 0)
+                index['entries'] += replaced is None
+            if index['total_bytes'] > self.max_bytes:
+                index = self._evict()
+            self._write_index(index)
+
+    def _evict(self) -> Dict[str, Any]:
+        """Remove least recently used entries down to the low-water mark; returns the new index."""
+        found = self._scan()
+        total_bytes = sum(size for _, _, size in found)
+        target = self.max_bytes * self.low_water
+        evicted = 0
+        while total_bytes > target and len(found) - evicted > 1:
+            _, old_key, size = found[evicted]
+            for extension in ('bin', 'json'):
+                try:
+                    os.remove(self._path(old_key, extension))
+                except FileNotFoundError:
+                    pass
+            total_bytes -= size
+            evicted += 1
+        self.evictions += evicted
+        return {'entries': len(found) - evicted, 'total_bytes': total_bytes, 'scanned_at': time.time()}
+
+    def _write_atomic(self, path: str, content: bytes) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get the shared cache size and this process's hit/miss/eviction counters."""
+        index = self._read_index() or {'entries': 0, 'total_bytes': 0}
+        with self._lock:
+            return {
+                'entries': index['entries'],
+                'total_bytes': index['total_bytes'],
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions
+            }
@@ -0,0 +1,247 @@
+from collections import deque
+from typing import Any, Dict, Iterable, Iterator, Optional, Tuple
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from .pools import LazyProcessPool
+
+# One optimizer per worker process, created on first use
+_worker_optimizer = None
+
+def _optimize_in_worker(
+    image_data: bytes,
+    options: Dict[str, Any],
+    optimizer_options: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Run optimize_image inside a pool process and report when the work actually ran."""
+    global _worker_optimizer
+    if _worker_optimizer is None:
+        # Imported here so the API process can use the queue without loading Pillow
+        from .image_optimizer import create_optimizer
+        _worker_optimizer = create_optimizer(**optimizer_options)
+
+    started_at = time.time()
+    result = _worker_optimizer.optimize_image(image_data, **options)
+    return {'result': result, 'started_at': started_at, 'finished_at': time.time()}
+
+class QueueFullError(Exception):
+    """Raised when the job queue already holds max_pending unfinished jobs."""
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS image_jobs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    submitted_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    input_bytes INTEGER NOT NULL,
+    error TEXT,
+    result TEXT,
+    data BLOB
+);
+CREATE INDEX IF NOT EXISTS image_jobs_by_status ON image_jobs (status, submitted_at);
+"""
+
+class ImageJobQueue:
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: int = 64,
+        result_ttl: float = 900.0,
+        optimizer_options: Optional[Dict[str, Any]] = None,
+        store_path: str = ':memory:'
+    ):
+        """
+        Background image optimization on a bounded process pool.
+
+        Job status and results are kept in SQLite. With store_path set to a
+        file shared by every server worker, a job can be polled from any
+        worker, and max_pending bounds the jobs pending across all of them.
+        The default in-memory store only serves the process that submitted.
+
+        Args:
+            max_workers: Pool processes; defaults to the CPU count
+            max_pending: Maximum queued or running jobs before submit() is refused
+            result_ttl: Seconds a finished job (and its output bytes) is kept for
+                polling; jobs still pending after this long are assumed lost
+            optimizer_options: Keyword arguments for create_optimizer in each worker
+            store_path: SQLite database file for jobs, created if missing
+        """
+        self.max_workers = max_workers
+        self.max_pending = max_pending
+        self.result_ttl = result_ttl
+        self.optimizer_options = optimizer_options or {}
+        self.store_path = store_path
+        self._pool = LazyProcessPool(max_workers)
+        if store_path != ':memory:' and os.path.dirname(store_path):
+            os.makedirs(os.path.dirname(store_path), exist_ok=True)
+        self._conn = sqlite3.connect(store_path, check_same_thread=False, timeout=30)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.failed = 0
+
+    def submit(self, image_data: bytes, **options) -> str:
+        """Queue an optimize_image call and return its job ID."""
+        job_id = uuid.uuid4().hex
+        with self._lock, self._conn:
+            # BEGIN IMMEDIATE takes the write lock, so the count and insert are atomic across processes
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._expire_jobs()
+            if self._pending_count() >= self.max_pending:
+                raise QueueFullError(f"Image job queue is full ({self.max_pending} pending jobs)")
+            self._conn.execute(
+                "INSERT INTO image_jobs (id, status, submitted_at, input_bytes) VALUES (?, 'pending', ?, ?)",
+                (job_id, time.time(), len(image_data))
+            )
+
+        future = self._pool.get().submit(
+            _optimize_in_worker, image_data, options, self.optimizer_options
+        )
+        future.add_done_callback(lambda f: self._finish(job_id, f))
+        return job_id
+
+    def optimize_many(
+        self,
+        images: Iterable[Tuple[str, bytes]],
+        max_in_flight: Optional[int] = None,
+        **options
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Optimize a stream of (name, image bytes) pairs on the process pool.
+
+        Inputs are pulled lazily and at most max_in_flight images (default
+        twice the pool size) are held at once. Results are yielded in input
+        order as (name, outcome), where outcome has either 'result' with
+        timings or 'error'.
+        """
+        executor = self._pool.get()
+        if max_in_flight is None:
+            max_in_flight = 2 * (self.max_workers or os.cpu_count() or 1)
+
+        in_flight = deque()
+        images = iter(images)
+        while True:
+            while len(in_flight) < max_in_flight:
+                try:
+                    name, image_data = next(images)
+                except StopIteration:
+                    break
+                future = executor.submit(_optimize_in_worker, image_data, options, self.optimizer_options)
+                in_flight.append((name, future))
+            if not in_flight:
+                return
+
+            name, future = in_flight.popleft()
+            try:
+                outcome = future.result()
+                with self._lock:
+                    self.completed += 1
+            except Exception as e:
+                outcome = {'error': str(e)}
+                with self._lock:
+                    self.failed += 1
+            yield name, outcome
+
+    def _finish(self, job_id: str, future) -> None:
+        try:
+            outcome = future.result()
+        except Exception as e:
+            outcome = None
+            error = str(e)
+
+        with self._lock, self._conn:
+            if outcome is not None:
+                result = outcome['result']
+                self._conn.execute(
+                    "UPDATE image_jobs SET status = 'done', started_at = ?, finished_at = ?, result = ?, data = ? "
+                    "WHERE id = ?",
+                    (
+                        outcome['started_at'],
+                        outcome['finished_at'],
+                        json.dumps({k: v for k, v in result.items() if k != 'data'}),
+                        result['data'],
+                        job_id
+                    )
+                )
+                self.completed += 1
+            else:
+                self._conn.execute(
+                    "UPDATE image_jobs SET status = 'failed', error = ?, finished_at = ? WHERE id = ?",
+                    (error, time.time(), job_id)
+                )
+                self.failed += 1
+
+    def _pending_count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM image_jobs WHERE status = 'pending'").fetchone()[0]
+
+    def _expire_jobs(self) -> None:
+        cutoff = time.time() - self.result_ttl
+        self._conn.execute(
+            "DELETE FROM image_jobs WHERE (status = 'pending' AND submitted_at < ?) OR finished_at < ?",
+            (cutoff, cutoff)
+        )
+
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a job's status and timing.
+
+        Timings are in seconds: queue_seconds is submit to start and
+        run_seconds is start to finish inside the worker process.
+        Done jobs also carry the optimize_image result, including 'data'.
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, status, submitted_at, started_at, finished_at, input_bytes, error, result, data "
+                "FROM image_jobs WHERE id = ?",
+                (job_id,)
+            ).fetchone()
+        if row is None:
+            return None
+
+        job = {'id': row[0], 'status': row[1], 'submitted_at': row[2], 'input_bytes': row[5]}
+        if row[4] is not None:
+            job['finished_at'] = row[4]
+        if row[6] is not None:
+            job['error'] = row[6]
+        if row[7] is not None:
+            job['result'] = {**json.loads(row[7]), 'data': row[8]}
+        if row[3] is not None:
+            job['started_at'] = row[3]
+            job['queue_seconds'] = round(job['started_at'] - job['submitted_at'], 4)
+            job['run_seconds'] = round(job['finished_at'] - job['started_at'], 4)
+        return job
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth and job counters."""
+        with self._lock, self._conn:
+            self._expire_jobs()
+            return {
+                'queue_depth': self._pending_count(),
+                'max_pending': self.max_pending,
+                'tracked_jobs': self._conn.execute("SELECT COUNT(*) FROM image_jobs").fetchone()[0],
+                'completed': self.completed,
+                'failed': self.failed
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the process pool."""
+        self._pool.shutdown(wait=wait)
+
+def create_image_job_queue(
+    max_workers: Optional[int] = None,
+    max_pending: int = 64,
+    optimizer_options: Optional[Dict[str, Any]] = None,
+    store_path: str = ':memory:'
+) -> ImageJobQueue:
+    """Helper function to create an image job queue instance."""
+    return ImageJobQueue(
+        max_workers=max_workers,
+        max_pending=max_pending,
+        optimizer_options=optimizer_options,
+        store_path=store_path
+    )
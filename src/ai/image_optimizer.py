@@ -1,24 +1,64 @@
-from PIL import Image, ImageOps
+from PIL import Image, ImageOps, ExifTags
+from concurrent.futures import ThreadPoolExecutor
+from .image_cache import ImageCache
 import io
-from typing import Tuple, Optional, Dict
+from typing import Tuple, Optional, Dict, Sequence
 import os
 
+# EXIF orientations that rotate the image by 90 or 270 degrees
+TRANSPOSING_ORIENTATIONS = {5, 6, 7, 8}
+
 class ImageOptimizer:
-    def __init__(self):
+    def __init__(
+        self,
+        fast_decode: bool = True,
+        max_pixels: int = 50_000_000,
+        cache: Optional[ImageCache] = None
+    ):
         self.default_quality = 85
         self.default_max_size = (800, 800)
+        # Decode JPEGs at a reduced DCT scale when the output is much smaller than the original
+        self.fast_decode = fast_decode
+        # Refuse to decode images with more pixels than this (decompression bomb guard)
+        self.max_pixels = max_pixels
+        # Optional content-addressed store of previously optimized outputs
+        self.cache = cache
         self.supported_formats = {
             'JPEG': 'jpg',
             'PNG': 'png',
             'WEBP': 'webp'
         }
+        # Encoder effort settings per profile and format; 'max' is the slowest and smallest
+        self.profiles = {
+            'fast': {
+                'WEBP': {'method': 2},
+                'JPEG': {'optimize': False, 'progressive': False},
+                'PNG': {'optimize': False, 'compress_level': 3}
+            },
+            'balanced': {
+                'WEBP': {'method': 4},
+                'JPEG': {'optimize': True, 'progressive': False},
+                'PNG': {'optimize': False, 'compress_level': 6}
+            },
+            'max': {
+                'WEBP': {'method': 6},  # Highest compression method
+                'JPEG': {'optimize': True, 'progressive': True},
+                'PNG': {'optimize': True, 'compress_level': 9}  # Maximum compression
+            }
+        }
+        self.default_profile = 'max'
+        # Target-size mode never goes below this quality or past this many encodes
+        self.min_quality = 30
+        self.max_encode_attempts = 6
 
     def optimize_image(
         self,
         image_data: bytes,
         max_size: Optional[Tuple[int, int]] = None,
         quality: Optional[int] = None,
-        format: str = 'WEBP'
+        format: str = 'WEBP',
+        profile: Optional[str] = None,
+        target_kb: Optional[float] = None
     ) -> Dict[str, any]:
         """
         Optimize an image by resizing and compressing it.
@@ -26,8 +66,10 @@ class ImageOptimizer:
         Args:
             image_data: Raw image bytes
             max_size: Maximum dimensions (width, height)
-            quality: Compression quality (1-100)
+            quality: Compression quality (1-100); the upper bound when target_kb is set
             format: Output format ('WEBP', 'JPEG', 'PNG')
+            profile: Encoder effort profile ('fast', 'balanced', 'max')
+            target_kb: Byte budget; quality is binary-searched to fit under it
             
         Returns:
             Dict containing optimized image data and metadata
@@ -36,59 +78,42 @@ class ImageOptimizer:
             max_size = self.default_max_size
         if quality is None:
             quality = self.default_quality
+        format = self._check_format(format)
+        profile = self._check_profile(profile)
 
-        # Open image
-        img = Image.open(io.BytesIO(image_data))
-        
-        # Convert RGBA to RGB if necessary
-        if img.mode == 'RGBA' and format == 'JPEG':
-            img = self._remove_transparency(img)
-        
-        # Auto-orient image based on EXIF
-        img = ImageOps.exif_transpose(img)
-        
-        # Get original size
-        original_size = img.size
-        original_format = img.format
+        # Identical input and parameters always produce the same output
+        cache_key = None
+        if self.cache is not None:
+            cache_key = ImageCache.make_key(
+                image_data,
+                max_size=list(max_size),
+                quality=quality,
+                format=format,
+                profile=profile,
+                target_kb=target_kb
+            )
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                data, metadata = cached
+                return {**metadata, 'data': data, 'cache_key': cache_key, 'cached': True}
+
+        img, original_size = self._decode(image_data, max_size)
         
         # Resize if needed
         if img.size[0] > max_size[0] or img.size[1] > max_size[1]:
             img.thumbnail(max_size, Image.Resampling.LANCZOS)
         
-        # Optimize and save
-        output = io.BytesIO()
-        
-        save_kwargs = {
-            'quality': quality,
-            'optimize': True
-        }
-        
-        # Format-specific optimizations
-        if format == 'WEBP':
-            save_kwargs.update({
-                'method': 6,  # Highest compression method
-                'lossless': False
-            })
-        elif format == 'JPEG':
-            save_kwargs.update({
-                'progressive': True
-            })
-        elif format == 'PNG':
-            save_kwargs = {
-                'optimize': True,
-                'compress_level': 9  # Maximum compression
-            }
-        
-        # Save optimized image
-        img.save(output, format=format, **save_kwargs)
-        optimized_data = output.getvalue()
+        if target_kb is not None:
+            optimized_data, quality, attempts = self._encode_to_target(img, format, quality, profile, target_kb)
+        else:
+            optimized_data, attempts = self._encode(img, format, quality, profile), 1
         
         # Calculate compression ratio
         original_size_kb = len(image_data) / 1024
         optimized_size_kb = len(optimized_data) / 1024
         compression_ratio = (1 - (optimized_size_kb / original_size_kb)) * 100
         
-        return {
+        result = {
             'data': optimized_data,
             'format': format.lower(),
             'original_size': original_size,
@@ -96,8 +121,236 @@ class ImageOptimizer:
             'original_weight_kb': round(original_size_kb, 2),
             'optimized_weight_kb': round(optimized_size_kb, 2),
             'compression_ratio': round(compression_ratio, 2),
-            'quality': quality
+            'quality': quality,
+            'profile': profile,
+            'encode_attempts': attempts
         }
+        
+        if self.cache is not None:
+            self.cache.put(cache_key, optimized_data, {k: v for k, v in result.items() if k != 'data'})
+            result.update(cache_key=cache_key, cached=False)
+        return result
+
+    def generate_variants(
+        self,
+        image_data: bytes,
+        widths: Sequence[int] = (200, 400, 800, 1600),
+        formats: Sequence[str] = ('WEBP', 'JPEG'),
+        quality: Optional[int] = None,
+        profile: Optional[str] = None
+    ) -> Dict[str, any]:
+        """
+        Generate responsive variants of an image from a single decode.
+
+        The image is decoded once at the largest requested width, then each
+        smaller width is downscaled from the previous level. Sizes are
+        encoded in parallel on a thread pool, since Pillow releases the GIL
+        while encoding. Widths larger than the original are not upscaled;
+        they are replaced by a single variant at the original width.
+        
+        Args:
+            image_data: Raw image bytes
+            widths: Target widths in pixels; heights follow the aspect ratio
+            formats: Output formats ('WEBP', 'JPEG', 'PNG')
+            quality: Compression quality (1-100)
+            profile: Encoder effort profile ('fast', 'balanced', 'max')
+            
+        Returns:
+            Dict with the original size and a 'variants' manifest, largest first
+        """
+        if quality is None:
+            quality = self.default_quality
+        profile = self._check_profile(profile)
+        formats = [self._check_format(format) for format in formats]
+
+        # Variants are bounded by width only, so the decode target has no height limit
+        img, original_size = self._decode(image_data, (max(widths), 1 << 30))
+        requested = {w for w in widths if w > 0}
+        fitting = {w for w in requested if w <= original_size[0]}
+        # Clipped widths are served by one variant at the original width
+        if len(fitting) < len(requested):
+            fitting.add(original_size[0])
+        widths = sorted(fitting, reverse=True)
+
+        # Downscale pyramid: each level is derived from the previous, larger one
+        levels = []
+        level = img
+        for width in widths:
+            height = max(1, round(original_size[1] * width / original_size[0]))
+            if level.size != (width, height):
+                level = level.resize((width, height), Image.Resampling.LANCZOS)
+            levels.append(level)
+
+        # Image.save keeps per-call encoder state on the image, so each level is
+        # encoded by a single task, one format after another
+        def encode_level(level):
+            return [self._encode(level, format, quality, profile) for format in formats]
+
+        with ThreadPoolExecutor(max_workers=max(1, min(len(levels), os.cpu_count() or 1))) as executor:
+            encoded = list(executor.map(encode_level, levels))
+
+        variants = [
+            {
+                'width': level.size[0],
+                'height': level.size[1],
+                'format': format.lower(),
+                'weight_kb': round(len(data) / 1024, 2),
+                'data': data
+            }
+            for level, level_data in zip(levels, encoded)
+            for format, data in zip(formats, level_data)
+        ]
+        return {
+            'original_size': original_size,
+            'original_weight_kb': round(len(image_data) / 1024, 2),
+            'quality': quality,
+            'profile': profile,
+            'variants': variants
+        }
+
+    def _decode(self, image_data: bytes, max_size: Tuple[int, int]) -> Tuple[Image.Image, Tuple[int, int]]:
+        """
+        Decode an image no larger than needed to produce max_size, upright per EXIF.
+
+        Returns:
+            Tuple of (image, original size as displayed after EXIF orientation)
+        """
+        # Open image; this only reads the header, pixels are decoded on first access
+        img = Image.open(io.BytesIO(image_data))
+        self._check_pixels(img)
+        
+        # Get original size, as displayed after EXIF orientation
+        original_size = img.size
+        transposed = img.getexif().get(ExifTags.Base.Orientation) in TRANSPOSING_ORIENTATIONS
+        if transposed:
+            original_size = original_size[::-1]
+        
+        # Let the JPEG decoder downscale by 1/2, 1/4 or 1/8 while decoding
+        if self.fast_decode:
+            self._draft(img, original_size, max_size, transposed)
+        
+        # Auto-orient image based on EXIF
+        return ImageOps.exif_transpose(img), original_size
+
+    def _encode(self, img: Image.Image, format: str, quality: int, profile: str) -> bytes:
+        """Encode an image with the format-specific settings of an effort profile."""
+        # Convert transparent or palette images to RGB if necessary
+        if format == 'JPEG' and img.mode not in ('RGB', 'L'):
+            img = self._remove_transparency(img)
+            if img.mode != 'RGB':
+                img = img.convert('RGB')
+        
+        # Optimize and save
+        output = io.BytesIO()
+        
+        save_kwargs = dict(self.profiles[profile].get(format, {}))
+        
+        # Format-specific optimizations
+        if format == 'WEBP':
+            save_kwargs.update({
+                'quality': quality,
+                'lossless': False
+            })
+        elif format == 'JPEG':
+            save_kwargs['quality'] = quality
+        
+        # Save optimized image
+        img.save(output, format=format, **save_kwargs)
+        return output.getvalue()
+
+    def _encode_to_target(
+        self,
+        img: Image.Image,
+        format: str,
+        max_quality: int,
+        profile: str,
+        target_kb: float
+    ) -> Tuple[bytes, int, int]:
+        """
+        Binary-search the highest quality whose output fits in target_kb.
+
+        At most max_encode_attempts encodes are made. If nothing fits, the
+        smallest output found is returned. PNG is lossless, so it is encoded once.
+
+        Returns:
+            Tuple of (encoded bytes, quality used, number of encodes)
+        """
+        if format == 'PNG':
+            return self._encode(img, format, max_quality, profile), max_quality, 1
+
+        target_bytes = target_kb * 1024
+
+        # Most images already fit at the requested quality
+        data = self._encode(img, format, max_quality, profile)
+        if len(data) <= target_bytes:
+            return data, max_quality, 1
+
+        low, high = self.min_quality, max_quality - 1
+        best = None
+        smallest = (data, max_quality)
+        attempts = 1
+        while low <= high and attempts < self.max_encode_attempts:
+            quality = (low + high + 1) // 2
+            data = self._encode(img, format, quality, profile)
+            attempts += 1
+            if len(data) < len(smallest[0]):
+                smallest = (data, quality)
+            if len(data) <= target_bytes:
+                best = (data, quality)
+                low = quality + 1
+            else:
+                high = quality - 1
+
+        data, quality = best or smallest
+        return data, quality, attempts
+
+    def _check_format(self, format: str) -> str:
+        """Upper-case an output format and reject unsupported ones."""
+        normalized = str(format).strip().upper()
+        if normalized not in self.supported_formats:
+            raise ValueError(f"Unsupported format '{format}', expected one of {self.get_supported_formats()}")
+        return normalized
+
+    def _check_profile(self, profile: Optional[str]) -> str:
+        """Resolve the default profile and reject unknown ones."""
+        profile = profile or self.default_profile
+        if profile not in self.profiles:
+            raise ValueError(f"Unknown profile '{profile}', expected one of {self.get_profiles()}")
+        return profile
+
+    def _check_pixels(self, img: Image.Image) -> None:
+        """Raise ValueError before decoding an image with more than max_pixels pixels."""
+        width, height = img.size
+        if width * height > self.max_pixels:
+            raise ValueError(
+                f"Image is too large to process ({width}x{height} pixels, limit {self.max_pixels})"
+            )
+
+    def _draft(
+        self,
+        img: Image.Image,
+        original_size: Tuple[int, int],
+        max_size: Tuple[int, int],
+        transposed: bool
+    ) -> None:
+        """
+        Configure the decoder to produce the smallest reduced scale that still
+        leaves at least twice the output size for the final LANCZOS pass.
+        """
+        if img.format != 'JPEG':
+            return
+        scale = min(max_size[0] / original_size[0], max_size[1] / original_size[1])
+        if scale >= 0.5:
+            return
+
+        # Keep a 2x margin, as Image.thumbnail does with its default reducing_gap
+        request = (
+            max(1, int(original_size[0] * scale * 2)),
+            max(1, int(original_size[1] * scale * 2))
+        )
+        if transposed:
+            request = request[::-1]
+        img.draft(None, request)
 
     def _remove_transparency(self, img: Image.Image) -> Image.Image:
         """Remove transparency by compositing on white background."""
@@ -113,6 +366,14 @@ class ImageOptimizer:
         """Get list of supported image formats."""
         return list(self.supported_formats.keys())
 
-def create_optimizer() -> ImageOptimizer:
-    """Helper function to create an image optimizer instance."""
-    return ImageOptimizer()
+    def get_profiles(self) -> list:
+        """Get list of encoding profiles."""
+        return list(self.profiles.keys())
+
+def create_optimizer(
+    cache_dir: Optional[str] = None,
+    cache_max_bytes: int = 512 * 1024 * 1024
+) -> ImageOptimizer:
+    """Helper function to create an image optimizer instance, cached on disk if cache_dir is set."""
+    cache = ImageCache(cache_dir, max_bytes=cache_max_bytes) if cache_dir else None
+    return ImageOptimizer(cache=cache)
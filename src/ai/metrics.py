@@ -0,0 +1,156 @@
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+import logging
+import random
+import threading
+import time
+
+# Latency buckets in seconds, from cache hits up to slow image and review work
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+# A collector returns (name, type, help, [(labels, value), ...]) families at scrape time
+Collector = Callable[[], List[Tuple[str, str, str, List[Tuple[Dict[str, str], float]]]]]
+
+class Metrics:
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        """
+        In-process counters, gauges and latency histograms.
+
+        Updates are a dict lookup and an add under one lock, so they are
+        cheap enough for every request. render() produces the Prometheus
+        text exposition format.
+
+        Args:
+            buckets: Upper bounds in seconds of the histogram buckets
+        """
+        self.buckets = tuple(buckets)
+        self._counters = {}
+        self._gauges = {}
+        self._histograms = {}
+        self._help = {}
+        self._collectors = []
+        self._lock = threading.Lock()
+
+    def inc(self, name: str, help: str = "", value: float = 1, **labels) -> None:
+        """Increment a counter."""
+        key = self._key(labels)
+        with self._lock:
+            series = self._family(self._counters, name, help)
+            series[key] = series.get(key, 0) + value
+
+    def add_gauge(self, name: str, value: float, help: str = "", **labels) -> None:
+        """Add value (which may be negative) to a gauge."""
+        key = self._key(labels)
+        with self._lock:
+            series = self._family(self._gauges, name, help)
+            series[key] = series.get(key, 0) + value
+
+    def observe(self, name: str, value: float, help: str = "", **labels) -> None:
+        """Record an observation, e.g. a latency in seconds, in a histogram."""
+        key = self._key(labels)
+        bucket = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._family(self._histograms, name, help)
+            histogram = series.get(key)
+            if histogram is None:
+                # Per-bucket counts (the last is +Inf), then sum and count
+                histogram = series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            histogram[0][bucket] += 1
+            histogram[1] += value
+            histogram[2] += 1
+
+    @contextmanager
+    def timer(self, name: str, help: str = "", **labels) -> Iterator[None]:
+        """Observe the duration of the with block in a histogram."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, help, **labels)
+
+    def add_collector(self, collector: Collector) -> None:
+        """Register a callable producing metric families at scrape time."""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """Render every metric in the Prometheus text format."""
+        lines = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                self._header(lines, name, "counter", self._help[name])
+                lines.extend(f"{name}{self._labels(key)} {value}" for key, value in series.items())
+            for name, series in sorted(self._gauges.items()):
+                self._header(lines, name, "gauge", self._help[name])
+                lines.extend(f"{name}{self._labels(key)} {value}" for key, value in series.items())
+            for name, series in sorted(self._histograms.items()):
+                self._header(lines, name, "histogram", self._help[name])
+                for key, (counts, total, count) in series.items():
+                    cumulative = 0
+                    for bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                        cumulative += bucket_count
+                        le = "+Inf" if bound == float("inf") else repr(bound)
+                        lines.append(f"{name}_bucket{self._labels(key + (('le', le),))} {cumulative}")
+                    lines.append(f"{name}_sum{self._labels(key)} {total}")
+                    lines.append(f"{name}_count{self._labels(key)} {count}")
+
+        for collector in self._collectors:
+            try:
+                families = collector()
+            except Exception as e:
+                logging.getLogger(__name__).error("Metrics collector failed: %s", e)
+                continue
+            for name, metric_type, help, samples in families:
+                self._header(lines, name, metric_type, help)
+                lines.extend(f"{name}{self._labels(self._key(labels))} {value}" for labels, value in samples)
+        return "\n".join(lines) + "\n"
+
+    def _family(self, families: Dict, name: str, help: str) -> Dict:
+        if name not in families:
+            families[name] = {}
+            self._help[name] = help
+        return families[name]
+
+    @staticmethod
+    def _key(labels: Dict[str, str]) -> Tuple:
+        return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    @staticmethod
+    def _labels(key: Tuple) -> str:
+        if not key:
+            return ""
+        escaped = (v.replace("\\", "\\\\").replace("\"", "\\\"").replace("\n", "\\n") for _, v in key)
+        return "{" + ",".join(f'{k}="{v}"' for (k, _), v in zip(key, escaped)) + "}"
+
+    @staticmethod
+    def _header(lines: List[str], name: str, metric_type: str, help: str) -> None:
+        if help:
+            lines.append(f"# HELP {name} {help}")
+        lines.append(f"# TYPE {name} {metric_type}")
+
+class SamplingFilter(logging.Filter):
+    def __init__(self, rate: float):
+        """
+        Pass a random fraction of log records below WARNING.
+
+        Warnings and errors always pass, so failures are never sampled away.
+
+        Args:
+            rate: Fraction of records to keep, 0 to 1
+        """
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        return record.levelno >= logging.WARNING or random.random() < self.rate
+
+def create_sampled_logger(name: str, rate: float) -> logging.Logger:
+    """Get a logger whose info and debug records are sampled at rate."""
+    logger = logging.getLogger(name)
+    logger.filters = [f for f in logger.filters if not isinstance(f, SamplingFilter)]
+    logger.addFilter(SamplingFilter(rate))
+    return logger
+
+def create_metrics(buckets: Optional[Tuple[float, ...]] = None) -> Metrics:
+    """Helper function to create a metrics instance."""
+    return Metrics(buckets=buckets or DEFAULT_BUCKETS)
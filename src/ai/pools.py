@@ -0,0 +1,32 @@
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+import threading
+
+class LazyProcessPool:
+    def __init__(self, max_workers: Optional[int] = None):
+        """
+        Process pool started on first use.
+
+        Nothing forks until get() is first called, so importing the API
+        (e.g. in a gunicorn master) never starts worker processes.
+
+        Args:
+            max_workers: Pool processes; defaults to the CPU count
+        """
+        self.max_workers = max_workers
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def get(self) -> ProcessPoolExecutor:
+        """Get the pool, starting it if needed."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._executor
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes, if any were started."""
+        with self._lock:
+            if self._executor is not None:
+                self._executor.shutdown(wait=wait)
+                self._executor = None
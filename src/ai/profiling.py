@@ -0,0 +1,116 @@
+from collections import deque
+from typing import Any, Dict, List, Optional
+import cProfile
+import io
+import marshal
+import pstats
+import random
+import threading
+import time
+import uuid
+
+class RequestProfiler:
+    def __init__(self, enabled: bool = False, sample_rate: float = 0.0, max_profiles: int = 20, top_functions: int = 30):
+        """
+        Opt-in cProfile capture of individual requests.
+
+        A request is profiled when profiling is enabled and it either asks
+        for it or is picked by sampling. Only one request is profiled at a
+        time; requests arriving meanwhile run unprofiled. The last
+        max_profiles profiles are kept.
+
+        Args:
+            enabled: Whether any request may be profiled
+            sample_rate: Fraction of requests profiled without being asked, 0 to 1
+            max_profiles: Profiles kept in the ring buffer
+            top_functions: Functions listed in each profile's report
+        """
+        self.enabled = enabled
+        self.sample_rate = sample_rate
+        self.top_functions = top_functions
+        self._profiles = deque(maxlen=max_profiles)
+        self._active = threading.Lock()
+        self._lock = threading.Lock()
+
+    def start(self, requested: bool = False) -> Optional[cProfile.Profile]:
+        """
+        Start profiling the current request if it should be profiled.
+
+        Args:
+            requested: Whether the request explicitly asked to be profiled
+
+        Returns:
+            The running profiler, to be passed to stop(), or None
+        """
+        if not self.enabled:
+            return None
+        if not requested and not (self.sample_rate > 0 and random.random() < self.sample_rate):
+            return None
+        # Profiling hooks are global to the interpreter, so profile one request at a time
+        if not self._active.acquire(blocking=False):
+            return None
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler (e.g. a debugger) is already active
+            self._active.release()
+            return None
+        profiler.started_at = time.time()
+        profiler.started = time.perf_counter()
+        return profiler
+
+    def stop(self, profiler: cProfile.Profile, **details) -> Dict[str, Any]:
+        """
+        Stop a profiler from start() and store its profile.
+
+        Args:
+            profiler: Profiler returned by start()
+            details: Request details stored with the profile (route, method, status...)
+
+        Returns:
+            Summary of the stored profile
+        """
+        try:
+            profiler.disable()
+        finally:
+            self._active.release()
+        duration = time.perf_counter() - profiler.started
+
+        report = io.StringIO()
+        stats = pstats.Stats(profiler, stream=report)
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(self.top_functions)
+        profiler.create_stats()
+
+        profile = {
+            'id': uuid.uuid4().hex,
+            'started_at': profiler.started_at,
+            'duration_ms': round(duration * 1000, 2),
+            **details,
+            'report': report.getvalue(),
+            # Same format as cProfile's dump_stats, loadable with pstats or snakeviz
+            'pstats': marshal.dumps(profiler.stats)
+        }
+        with self._lock:
+            self._profiles.append(profile)
+        return self._summary(profile)
+
+    def list_profiles(self) -> List[Dict[str, Any]]:
+        """Get summaries of the stored profiles, newest first."""
+        with self._lock:
+            return [self._summary(profile) for profile in reversed(self._profiles)]
+
+    def get_profile(self, profile_id: str) -> Optional[Dict[str, Any]]:
+        """Get a stored profile, including its text report and pstats data."""
+        with self._lock:
+            for profile in self._profiles:
+                if profile['id'] == profile_id:
+                    return dict(profile)
+        return None
+
+    def _summary(self, profile: Dict[str, Any]) -> Dict[str, Any]:
+        return {k: v for k, v in profile.items() if k not in ('report', 'pstats')}
+
+def create_request_profiler(enabled: bool = False, sample_rate: float = 0.0, max_profiles: int = 20) -> RequestProfiler:
+    """Helper function to create a request profiler instance."""
+    return RequestProfiler(enabled=enabled, sample_rate=sample_rate, max_profiles=max_profiles)
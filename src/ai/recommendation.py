@@ -1,55 +1,554 @@
-from typing import List, Dict, Any
+from typing import IO, Iterator, List, Dict, Any, Optional
+from contextlib import contextmanager
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+import scipy.sparse as sp
 import numpy as np
+import threading
+import json
+import logging
+import time
+import os
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the on-disk layout written by ProductRecommender.save changes
+MODEL_FORMAT_VERSION = 1
 
 class ProductRecommender:
-    def __init__(self, products: List[Dict[str, Any]]):
-        self.products = {str(p['id']): p for p in products}
-        self.vectorizer = TfidfVectorizer(stop_words='english')
-        
-        # Create product features for similarity calculation
-        product_features = [
-            f"{p['name']} {p['description']} {p['category']} {p['brand']}"
-            for p in products
-        ]
-        
-        # Calculate similarity matrix
-        self.tfidf_matrix = self.vectorizer.fit_transform(product_features)
-        self.similarity_matrix = cosine_similarity(self.tfidf_matrix)
-        
-        # Store product indices for lookup
-        self.product_indices = {str(p['id']): idx for idx, p in enumerate(products)}
+    def __init__(
+        self,
+        products: List[Dict[str, Any]],
+        num_neighbors: int = 20,
+        block_size: int = 256,
+        drift_threshold: float = 0.1
+    ):
+        self._init_settings(num_neighbors, block_size, drift_threshold)
+        self._fit(products)
+
+    def _init_settings(
+        self,
+        num_neighbors: int = 20,
+        block_size: int = 256,
+        drift_threshold: float = 0.1
+    ) -> None:
+        """Set tuning parameters and synchronization state shared by __init__ and load()."""
+        self.num_neighbors = num_neighbors
+        self.block_size = block_size
+        self.drift_threshold = drift_threshold
+        # Guards the catalog state; readers hold it too, since updates replace
+        # several attributes and rewrite neighbor rows in place
+        self._lock = threading.RLock()
+        # Bumped on every catalog change, so a refit computed outside the lock can tell it is stale
+        self._version = 0
+        self._refit_thread = None
+        self._stop_refit = threading.Event()
+
+    def _fit(self, products: List[Dict[str, Any]]) -> None:
+        """Fit TF-IDF on the full catalog and build the neighbor index from scratch."""
+        self._set_state(*self._fitted_state(products))
+
+    def _fitted_state(self, products: List[Dict[str, Any]]) -> tuple:
+        """Fit a vectorizer and neighbor index without touching the current state."""
+        vectorizer = TfidfVectorizer(stop_words='english', dtype=np.float32)
+
+        # Fit TF-IDF and build the top-K neighbor index
+        tfidf_matrix = vectorizer.fit_transform([self._product_features(p) for p in products])
+        neighbor_ids, neighbor_scores = self._build_neighbor_index(tfidf_matrix)
+        return vectorizer, tfidf_matrix, neighbor_ids, neighbor_scores, products
+
+    def _set_state(self, vectorizer, tfidf_matrix, neighbor_ids, neighbor_scores, products) -> None:
+        """Swap in a fitted vectorizer, TF-IDF matrix and neighbor index."""
+        with self._lock:
+            self._version += 1
+            self.vectorizer = vectorizer
+            self.analyzer = vectorizer.build_analyzer()
+            self.tfidf_matrix = tfidf_matrix
+            self.neighbor_ids, self.neighbor_scores = neighbor_ids, neighbor_scores
+            self.products = {str(p['id']): p for p in products}
+
+            # Store product indices for lookup, and the reverse mapping from index to ID
+            self.product_indices = {str(p['id']): idx for idx, p in enumerate(products)}
+            self.product_ids = [str(p['id']) for p in products]
+
+            # Vocabulary drift counters, reset on every full fit
+            self.total_tokens = 0
+            self.unknown_tokens = 0
+
+    def save(self, path: str) -> None:
+        """
+        Save the fitted model as a versioned artifact directory.
+
+        The TF-IDF matrix and neighbor index are written as plain .npy files
+        so that load() can memory-map them; the vocabulary, IDF weights and
+        products are stored alongside with a manifest describing the format.
+        Every file is written under a temporary name and renamed into place,
+        so workers that still map the previous artifact keep their old files.
+        """
+        with self._lock:
+            os.makedirs(path, exist_ok=True)
+            manifest_path = os.path.join(path, 'manifest.json')
+            if os.path.exists(manifest_path):
+                os.remove(manifest_path)
+            tfidf_matrix = self.tfidf_matrix.tocsr()
+
+            arrays = {
+                'tfidf_data': tfidf_matrix.data,
+                'tfidf_indices': tfidf_matrix.indices,
+                'tfidf_indptr': tfidf_matrix.indptr,
+                'neighbor_ids': self.neighbor_ids,
+                'neighbor_scores': self.neighbor_scores,
+                'idf': self.vectorizer.idf_
+            }
+            for name, array in arrays.items():
+                with self._replace_file(os.path.join(path, f'{name}.npy'), 'wb') as f:
+                    np.save(f, array)
+
+            with self._replace_file(os.path.join(path, 'vocabulary.json'), 'w') as f:
+                json.dump({term: int(idx) for term, idx in self.vectorizer.vocabulary_.items()}, f)
+            with self._replace_file(os.path.join(path, 'products.json'), 'w') as f:
+                json.dump([self.products[pid] for pid in self.product_ids], f, ensure_ascii=False)
+
+            # Written last, so a partially written artifact is never loadable
+            with self._replace_file(manifest_path, 'w') as f:
+                json.dump({
+                    'format_version': MODEL_FORMAT_VERSION,
+                    'created_at': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+                    'num_products': len(self.product_ids),
+                    'num_neighbors': self.num_neighbors,
+                    'tfidf_shape': list(tfidf_matrix.shape)
+                }, f, indent=2)
+
+    @staticmethod
+    @contextmanager
+    def _replace_file(path: str, mode: str) -> Iterator[IO]:
+        """
+        Open a temporary file that replaces path once the with block completes.
+
+        A rename swaps the directory entry without touching the old inode, so
+        a file that is memory-mapped elsewhere is never truncated under it.
+        """
+        tmp_path = f"{path}.tmp"
+        encoding = None if 'b' in mode else 'utf-8'
+        try:
+            with open(tmp_path, mode, encoding=encoding) as f:
+                yield f
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    @classmethod
+    def load(cls, path: str, mmap_mode: Optional[str] = 'r', **kwargs) -> 'ProductRecommender':
+        """
+        Load a model artifact written by save().
+
+        With mmap_mode='r' the large arrays are memory-mapped rather than read,
+        so workers start without refitting and share pages through the OS cache.
+        The arrays are copied on the first incremental update.
+        """
+        with open(os.path.join(path, 'manifest.json'), 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('format_version') != MODEL_FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported recommender model format {manifest.get('format_version')}, "
+                f"expected {MODEL_FORMAT_VERSION}"
+            )
+
+        with open(os.path.join(path, 'vocabulary.json'), 'r', encoding='utf-8') as f:
+            vocabulary = json.load(f)
+        with open(os.path.join(path, 'products.json'), 'r', encoding='utf-8') as f:
+            products = json.load(f)
+
+        def load_array(name):
+            return np.load(os.path.join(path, f'{name}.npy'), mmap_mode=mmap_mode)
+
+        vectorizer = TfidfVectorizer(stop_words='english', dtype=np.float32, vocabulary=vocabulary)
+        vectorizer.idf_ = np.asarray(load_array('idf'))
+
+        tfidf_matrix = sp.csr_matrix(
+            (load_array('tfidf_data'), load_array('tfidf_indices'), load_array('tfidf_indptr')),
+            shape=tuple(manifest['tfidf_shape'])
+        )
+
+        recommender = cls.__new__(cls)
+        recommender._init_settings(num_neighbors=manifest['num_neighbors'], **kwargs)
+        recommender._set_state(
+            vectorizer, tfidf_matrix, load_array('neighbor_ids'), load_array('neighbor_scores'), products
+        )
+        return recommender
+
+    def _ensure_writable(self) -> None:
+        """Copy memory-mapped arrays into private memory before mutating them."""
+        if not self.neighbor_ids.flags.writeable:
+            self.neighbor_ids = np.array(self.neighbor_ids)
+            self.neighbor_scores = np.array(self.neighbor_scores)
+        if not self.tfidf_matrix.data.flags.writeable:
+            self.tfidf_matrix = self.tfidf_matrix.copy()
+
+    def _product_features(self, product: Dict[str, Any]) -> str:
+        """Create product features for similarity calculation."""
+        return f"{product['name']} {product['description']} {product['category']} {product['brand']}"
+
+    def _build_neighbor_index(self, tfidf_matrix) -> tuple:
+        """
+        Build a top-K nearest neighbor index over the TF-IDF matrix.
+
+        Similarities are computed one block of rows at a time so that only a
+        block_size x N slice is ever dense; the result keeps K neighbors per
+        product, sorted by descending cosine similarity.
+
+        Returns:
+            Tuple of (neighbor_ids, neighbor_scores) arrays of shape (N, K),
+            int32 and float32 respectively
+        """
+        n_products = tfidf_matrix.shape[0]
+        k = min(self.num_neighbors, max(n_products - 1, 0))
+        return self._top_neighbors(tfidf_matrix, np.arange(n_products), k)
+
+    def _top_neighbors(self, tfidf_matrix, rows: np.ndarray, k: int) -> tuple:
+        """Compute the sorted top-k neighbors of the given rows against the whole matrix."""
+        neighbor_ids = np.empty((len(rows), k), dtype=np.int32)
+        neighbor_scores = np.empty((len(rows), k), dtype=np.float32)
+        if k == 0:
+            return neighbor_ids, neighbor_scores
+
+        # TfidfVectorizer rows are L2-normalized, so the dot product is the cosine similarity
+        for start in range(0, len(rows), self.block_size):
+            block_rows = rows[start:start + self.block_size]
+            # Sparse x dense is much faster than sparse x sparse for a near-dense result
+            block = np.asarray(tfidf_matrix @ tfidf_matrix[block_rows].T.toarray()).T
+            block = block.astype(np.float32, copy=False)
+
+            # Never recommend a product for itself
+            block[np.arange(len(block_rows)), block_rows] = -np.inf
+
+            # Select the top K per row, then order just those K
+            top = np.argpartition(-block, k - 1, axis=1)[:, :k]
+            top_scores = np.take_along_axis(block, top, axis=1)
+            order = np.argsort(-top_scores, axis=1, kind='stable')
+
+            end = start + len(block_rows)
+            neighbor_ids[start:end] = np.take_along_axis(top, order, axis=1)
+            neighbor_scores[start:end] = np.take_along_axis(top_scores, order, axis=1)
+
+        return neighbor_ids, neighbor_scores
 
     def get_recommendations(self, product_id: str, num_recommendations: int = 3) -> List[Dict[str, Any]]:
         """Get product recommendations based on content similarity."""
         try:
-            # Get the index of the product
-            product_idx = self.product_indices.get(str(product_id))
-            if product_idx is None:
-                return []
-
-            # Get similarity scores for the product
-            similarity_scores = self.similarity_matrix[product_idx]
-            
-            # Get indices of most similar products (excluding the product itself)
-            similar_indices = similarity_scores.argsort()[::-1][1:num_recommendations + 1]
-            
-            # Get the product IDs from indices
-            recommended_products = []
-            for idx in similar_indices:
-                product_id = next(
-                    (pid for pid, index in self.product_indices.items() if index == idx),
-                    None
+            with self._lock:
+                # Get the index of the product
+                product_idx = self.product_indices.get(str(product_id))
+                if product_idx is None or num_recommendations <= 0:
+                    return []
+
+                if num_recommendations <= self.neighbor_ids.shape[1]:
+                    # Neighbors are precomputed and already sorted by similarity
+                    similar_indices = self.neighbor_ids[product_idx, :num_recommendations]
+                else:
+                    similar_indices = self._rank_similar(product_idx, num_recommendations)
+
+                return [self.products[self.product_ids[idx]] for idx in similar_indices]
+        except Exception as e:
+            logger.error("Error generating recommendations: %s", e)
+            return []
+
+    def _rank_similar(self, product_idx: int, num_recommendations: int) -> np.ndarray:
+        """Rank products against one row when more neighbors are requested than the index holds."""
+        scores = self.tfidf_matrix @ self.tfidf_matrix[product_idx].toarray().ravel()
+        scores[product_idx] = -np.inf
+
+        k = min(num_recommendations, len(scores) - 1)
+        if k <= 0:
+            return np.empty(0, dtype=np.int32)
+
+        # Partition out the top k in O(N), then sort only those k
+        top = np.argpartition(-scores, k - 1)[:k]
+        return top[np.argsort(-scores[top], kind='stable')]
+
+    def get_batch_recommendations(
+        self,
+        product_ids: List[str],
+        num_recommendations: int = 3
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """Get recommendations for many products at once, keyed by product ID."""
+        try:
+            with self._lock:
+                known = [str(pid) for pid in product_ids if str(pid) in self.product_indices]
+                results = {str(pid): [] for pid in product_ids}
+                if not known or num_recommendations <= 0:
+                    return results
+
+                seeds = np.array([self.product_indices[pid] for pid in known])
+                if num_recommendations <= self.neighbor_ids.shape[1]:
+                    # One fancy-indexing pass over the neighbor index for every seed
+                    similar_indices = self.neighbor_ids[seeds, :num_recommendations]
+                else:
+                    similar_indices = [self._rank_similar(idx, num_recommendations) for idx in seeds]
+
+                for pid, indices in zip(known, similar_indices):
+                    results[pid] = [self.products[self.product_ids[idx]] for idx in indices]
+                return results
+        except Exception as e:
+            logger.error("Error generating batch recommendations: %s", e)
+            return {str(pid): [] for pid in product_ids}
+
+    def get_basket_recommendations(
+        self,
+        product_ids: List[str],
+        num_recommendations: int = 3
+    ) -> List[Dict[str, Any]]:
+        """
+        Get recommendations for a basket of products.
+
+        Neighbor scores of all seeds are summed per candidate, so products that
+        are similar to several basket items rank first. Seed products are never
+        recommended and each product appears at most once.
+        """
+        try:
+            with self._lock:
+                seeds = np.array(
+                    [self.product_indices[str(pid)] for pid in product_ids if str(pid) in self.product_indices],
+                    dtype=np.int32
                 )
-                if product_id and product_id in self.products:
-                    recommended_products.append(self.products[product_id])
-            
-            return recommended_products
+                if len(seeds) == 0 or num_recommendations <= 0:
+                    return []
+
+                candidates, inverse = np.unique(self.neighbor_ids[seeds].ravel(), return_inverse=True)
+                scores = np.bincount(inverse, weights=self.neighbor_scores[seeds].ravel())
+
+                keep = ~np.isin(candidates, seeds)
+                candidates, scores = candidates[keep], scores[keep]
+
+                k = min(num_recommendations, len(candidates))
+                if k == 0:
+                    return []
+                top = np.argpartition(-scores, k - 1)[:k]
+                top = top[np.argsort(-scores[top], kind='stable')]
+
+                return [self.products[self.product_ids[idx]] for idx in candidates[top]]
         except Exception as e:
-            print(f"Error generating recommendations: {str(e)}")
+            logger.error("Error generating basket recommendations: %s", e)
             return []
 
-def create_recommender(products: List[Dict[str, Any]]) -> ProductRecommender:
-    """Create and return a product recommender instance."""
+    def add_products(self, products: List[Dict[str, Any]]) -> None:
+        """
+        Add products to the catalog without refitting the vectorizer.
+
+        New products are transformed against the fitted vocabulary, get their
+        own neighbor lists, and are merged into the neighbor lists of existing
+        products wherever they beat the current K-th neighbor. Products whose
+        ID already exists are updated instead.
+        """
+        with self._lock:
+            self._ensure_writable()
+            self._version += 1
+            # Keyed by ID, so an ID repeated within the call is added once, last version winning
+            new_products = {}
+            for product in products:
+                if str(product['id']) in self.products:
+                    self.update_product(product)
+                else:
+                    new_products[str(product['id'])] = product
+            new_products = list(new_products.values())
+            if not new_products:
+                return
+
+            # A catalog too small to fill K neighbors is cheap to refit outright
+            if self.neighbor_ids.shape[1] < self.num_neighbors:
+                self._fit([self.products[pid] for pid in self.product_ids] + new_products)
+                return
+
+            start = self.tfidf_matrix.shape[0]
+            self.tfidf_matrix = sp.vstack(
+                [self.tfidf_matrix, self._transform(new_products)], format='csr'
+            )
+            new_indices = np.arange(start, self.tfidf_matrix.shape[0])
+
+            k = self.neighbor_ids.shape[1]
+            ids, scores = self._top_neighbors(self.tfidf_matrix, new_indices, k)
+            self.neighbor_ids = np.vstack([self.neighbor_ids, ids])
+            self.neighbor_scores = np.vstack([self.neighbor_scores, scores])
+
+            for product in new_products:
+                product_id = str(product['id'])
+                self.products[product_id] = product
+                self.product_indices[product_id] = len(self.product_ids)
+                self.product_ids.append(product_id)
+
+            self._merge_candidates(new_indices, exclude=new_indices)
+
+    def remove_products(self, product_ids: List[str]) -> None:
+        """
+        Remove products from the catalog.
+
+        Rows are compacted out of the TF-IDF matrix and the neighbor index;
+        only products that listed a removed product as a neighbor have their
+        neighbor lists recomputed.
+        """
+        with self._lock:
+            self._ensure_writable()
+            self._version += 1
+            removed = [self.product_indices[str(pid)] for pid in product_ids if str(pid) in self.product_indices]
+            if not removed:
+                return
+
+            n_products = self.tfidf_matrix.shape[0]
+            keep = np.ones(n_products, dtype=bool)
+            keep[removed] = False
+
+            # Map old positions to new ones; removed positions map to -1
+            remap = np.full(n_products, -1, dtype=np.int32)
+            remap[keep] = np.arange(keep.sum(), dtype=np.int32)
+
+            tfidf_matrix = self.tfidf_matrix[keep]
+            neighbor_ids = remap[self.neighbor_ids[keep]]
+            neighbor_scores = self.neighbor_scores[keep]
+
+            k = min(self.num_neighbors, max(tfidf_matrix.shape[0] - 1, 0))
+            if k < neighbor_ids.shape[1]:
+                # Too few products left to fill the index; rebuild it at the smaller K
+                neighbor_ids, neighbor_scores = self._build_neighbor_index(tfidf_matrix)
+            else:
+                affected = np.flatnonzero((neighbor_ids < 0).any(axis=1))
+                if len(affected):
+                    neighbor_ids[affected], neighbor_scores[affected] = self._top_neighbors(
+                        tfidf_matrix, affected, k
+                    )
+
+            product_ids = [pid for pid, kept in zip(self.product_ids, keep) if kept]
+            self.tfidf_matrix = tfidf_matrix
+            self.neighbor_ids, self.neighbor_scores = neighbor_ids, neighbor_scores
+            self.products = {pid: self.products[pid] for pid in product_ids}
+            self.product_indices = {pid: idx for idx, pid in enumerate(product_ids)}
+            self.product_ids = product_ids
+
+    def update_product(self, product: Dict[str, Any]) -> None:
+        """
+        Update a product's content in place.
+
+        The product's TF-IDF row and neighbor list are recomputed. Products
+        that listed it as a neighbor are recomputed too, since its score may
+        have dropped; every other product merges it in as a new candidate.
+        """
+        with self._lock:
+            self._ensure_writable()
+            self._version += 1
+            product_id = str(product['id'])
+            idx = self.product_indices.get(product_id)
+            if idx is None:
+                self.add_products([product])
+                return
+
+            self.tfidf_matrix = sp.vstack([
+                self.tfidf_matrix[:idx], self._transform([product]), self.tfidf_matrix[idx + 1:]
+            ], format='csr')
+            self.products[product_id] = product
+
+            affected = np.flatnonzero((self.neighbor_ids == idx).any(axis=1))
+            rows = np.union1d(affected, [idx])
+            self.neighbor_ids[rows], self.neighbor_scores[rows] = self._top_neighbors(
+                self.tfidf_matrix, rows, self.neighbor_ids.shape[1]
+            )
+            self._merge_candidates(np.array([idx]), exclude=rows)
+
+    def _merge_candidates(self, candidates: np.ndarray, exclude: np.ndarray) -> None:
+        """Merge candidate rows into the neighbor lists of every row not in exclude."""
+        k = self.neighbor_ids.shape[1]
+        if k == 0:
+            return
+
+        candidate_matrix = self.tfidf_matrix[candidates].T.toarray()
+        rows = np.setdiff1d(np.arange(self.tfidf_matrix.shape[0]), exclude)
+
+        for start in range(0, len(rows), self.block_size):
+            block_rows = rows[start:start + self.block_size]
+            candidate_scores = np.asarray(self.tfidf_matrix[block_rows] @ candidate_matrix)
+            candidate_scores = candidate_scores.astype(np.float32, copy=False)
+
+            # Skip rows where no candidate beats the current K-th neighbor
+            improved = (candidate_scores > self.neighbor_scores[block_rows, -1:]).any(axis=1)
+            if not improved.any():
+                continue
+            block_rows = block_rows[improved]
+            candidate_scores = candidate_scores[improved]
+
+            ids = np.hstack([
+                self.neighbor_ids[block_rows],
+                np.broadcast_to(candidates.astype(np.int32), candidate_scores.shape)
+            ])
+            scores = np.hstack([self.neighbor_scores[block_rows], candidate_scores])
+            order = np.argsort(-scores, axis=1, kind='stable')[:, :k]
+            self.neighbor_ids[block_rows] = np.take_along_axis(ids, order, axis=1)
+            self.neighbor_scores[block_rows] = np.take_along_axis(scores, order, axis=1)
+
+    def _transform(self, products: List[Dict[str, Any]]):
+        """Transform products against the fitted vocabulary, tracking out-of-vocabulary tokens."""
+        features = [self._product_features(p) for p in products]
+        vocabulary = self.vectorizer.vocabulary_
+        for text in features:
+            tokens = self.analyzer(text)
+            self.total_tokens += len(tokens)
+            self.unknown_tokens += sum(1 for token in tokens if token not in vocabulary)
+        return self.vectorizer.transform(features)
+
+    def get_vocabulary_drift(self) -> float:
+        """Fraction of tokens in incrementally added products missing from the fitted vocabulary."""
+        if self.total_tokens == 0:
+            return 0.0
+        return self.unknown_tokens / self.total_tokens
+
+    def refit(self) -> None:
+        """
+        Refit the vectorizer and rebuild the neighbor index over the current catalog.
+
+        The fit runs outside the lock so recommendations keep being served
+        meanwhile; if the catalog changed during the fit, it is redone under
+        the lock so that no update is lost.
+        """
+        with self._lock:
+            products = [self.products[pid] for pid in self.product_ids]
+            version = self._version
+        state = self._fitted_state(products)
+        with self._lock:
+            if self._version != version:
+                state = self._fitted_state([self.products[pid] for pid in self.product_ids])
+            self._set_state(*state)
+
+    def start_background_refit(self, interval: float = 300.0) -> None:
+        """Periodically refit in a background thread once vocabulary drift crosses drift_threshold."""
+        if self._refit_thread is not None and self._refit_thread.is_alive():
+            return
+
+        def run():
+            while not self._stop_refit.wait(interval):
+                drift = self.get_vocabulary_drift()
+                if drift > self.drift_threshold:
+                    try:
+                        logger.info("Vocabulary drift %.2f over threshold, refitting recommender", drift)
+                        self.refit()
+                    except Exception as e:
+                        logger.error("Error refitting recommender: %s", e)
+
+        self._stop_refit.clear()
+        self._refit_thread = threading.Thread(target=run, name='recommender-refit', daemon=True)
+        self._refit_thread.start()
+
+    def stop_background_refit(self) -> None:
+        """Stop the background refit thread."""
+        self._stop_refit.set()
+
+def create_recommender(
+    products: List[Dict[str, Any]],
+    model_path: Optional[str] = None
+) -> ProductRecommender:
+    """
+    Create and return a product recommender instance.
+
+    If model_path points at an artifact written by ProductRecommender.save,
+    the model is memory-mapped from disk instead of being fitted.
+    """
+    if model_path and os.path.exists(os.path.join(model_path, 'manifest.json')):
+        return ProductRecommender.load(model_path)
     return ProductRecommender(products)
@@ -1,10 +1,40 @@
-from textblob import TextBlob
-from collections import Counter
-from typing import List, Dict, Tuple, Optional
+from collections import Counter, deque
+from itertools import islice
+from typing import Any, List, Dict, Iterable, Tuple, Optional
+import os
 import re
+from .pools import LazyProcessPool
+from .sentiment import create_sentiment_backend
+
+# One analyzer per worker process, created on first use
+_worker_analyzer = None
+
+def _analyze_chunk_in_worker(reviews: List[Dict[str, str]], language: str, sentiment_backend: str) -> Dict[str, Any]:
+    """Compute the partial aggregate of a chunk of reviews inside a pool process."""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = ReviewAnalyzer(sentiment_backend=sentiment_backend)
+    return _worker_analyzer.analyze_chunk(reviews, language)
 
 class ReviewAnalyzer:
-    def __init__(self):
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        chunk_size: int = 2000,
+        sentiment_backend: str = "textblob"
+    ):
+        """
+        Initialize the review analyzer.
+
+        Args:
+            max_workers: Pool processes for analyze_reviews_parallel; defaults to the CPU count
+            chunk_size: Reviews per chunk sent to a pool process
+            sentiment_backend: "textblob" (per-review TextBlob) or "lexicon" (batched lexicon scorer)
+        """
+        self.sentiment = create_sentiment_backend(sentiment_backend)
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
+        self._pool = LazyProcessPool(max_workers)
         self.min_phrase_length = 3
         self.max_phrase_length = 5
         self.min_phrase_frequency = 2
@@ -22,6 +52,10 @@ class ReviewAnalyzer:
             }
         }
 
+        # Memoized (positive, negative) flags per token and language
+        self._token_flags = {}
+        self._sentiment_patterns = {}
+
     def analyze_reviews(
         self,
         reviews: List[Dict[str, str]],
@@ -37,7 +71,90 @@ class ReviewAnalyzer:
         Returns:
             Dictionary containing analysis results
         """
-        if not reviews:
+        return self._finalize(self.analyze_chunk(reviews, language), language)
+
+    def analyze_reviews_parallel(
+        self,
+        reviews: Iterable[Dict[str, str]],
+        language: str = "en"
+    ) -> Dict[str, any]:
+        """
+        Analyze a large or streamed collection of reviews on a process pool.
+
+        Reviews are read chunk_size at a time and analyzed in pool processes.
+        At most two chunks per worker are in flight, so memory stays bounded
+        however many reviews the iterable yields. The per-chunk partial
+        aggregates are merged in input order, giving the same result as
+        analyze_reviews.
+
+        Args:
+            reviews: Iterable of review dictionaries with 'text' and optional 'rating' keys
+            language: Language of reviews ('en' or 'hi')
+
+        Returns:
+            Dictionary containing analysis results
+        """
+        reviews = iter(reviews)
+        first = list(islice(reviews, self.chunk_size))
+        second = list(islice(reviews, self.chunk_size))
+        if not second:
+            # A single chunk is not worth the round trip to a worker
+            return self.analyze_reviews(first, language)
+
+        executor = self._pool.get()
+        max_in_flight = 2 * (self.max_workers or os.cpu_count() or 1)
+        in_flight = deque([
+            executor.submit(_analyze_chunk_in_worker, first, language, self.sentiment.name),
+            executor.submit(_analyze_chunk_in_worker, second, language, self.sentiment.name)
+        ])
+        del first, second
+
+        total = self._empty_partial()
+        while in_flight:
+            while len(in_flight) < max_in_flight:
+                chunk = list(islice(reviews, self.chunk_size))
+                if not chunk:
+                    break
+                in_flight.append(executor.submit(_analyze_chunk_in_worker, chunk, language, self.sentiment.name))
+            self.merge_partials(total, in_flight.popleft().result())
+        return self._finalize(total, language)
+
+    def analyze_chunk(self, reviews: List[Dict[str, str]], language: str = "en") -> Dict[str, Any]:
+        """
+        Compute the partial aggregate of a chunk of reviews.
+
+        Partials hold phrase counts, the sentiment sum and count and the
+        rating histogram, and combine with merge_partials.
+        """
+        partial = self._empty_partial()
+        # Get sentiment for the whole chunk at once
+        for polarity in self.sentiment.score_batch([review['text'] for review in reviews], language):
+            partial["sentiment_sum"] += polarity
+            partial["count"] += 1
+        
+        for review in reviews:
+            # Extract phrases
+            partial["phrases"].update(self._extract_phrases(review['text'], language))
+            
+            rating = review.get('rating', None)
+            if rating is not None:
+                partial["ratings"][rating] += 1
+        return partial
+
+    def merge_partials(self, total: Dict[str, Any], partial: Dict[str, Any]) -> Dict[str, Any]:
+        """Merge a partial aggregate into total, in place, and return total."""
+        total["phrases"].update(partial["phrases"])
+        total["sentiment_sum"] += partial["sentiment_sum"]
+        total["count"] += partial["count"]
+        total["ratings"].update(partial["ratings"])
+        return total
+
+    def _empty_partial(self) -> Dict[str, Any]:
+        return {"phrases": Counter(), "sentiment_sum": 0.0, "count": 0, "ratings": Counter()}
+
+    def _finalize(self, partial: Dict[str, Any], language: str) -> Dict[str, any]:
+        """Turn a (merged) partial aggregate into analysis results."""
+        if not partial["count"]:
             return {
                 "summary": {"pros": [], "cons": []},
                 "sentiment_score": 0,
@@ -45,74 +162,117 @@ class ReviewAnalyzer:
                 "total_reviews": 0
             }
 
-        # Extract text and ratings
-        review_texts = [r['text'] for r in reviews]
-        ratings = [r.get('rating', None) for r in reviews]
-        
-        # Analyze sentiment and extract phrases
-        sentiments = []
-        all_phrases = []
-        
-        for text in review_texts:
-            # Get sentiment
-            blob = TextBlob(text)
-            sentiment = blob.sentiment.polarity
-            sentiments.append(sentiment)
-            
-            # Extract phrases
-            phrases = self._extract_phrases(text, language)
-            all_phrases.extend(phrases)
+        positive_phrases, negative_phrases = self.split_phrases(partial["phrases"].most_common(), language)
 
-        # Separate positive and negative phrases
-        positive_phrases = []
-        negative_phrases = []
-        
-        for phrase, count in Counter(all_phrases).most_common():
-            if count >= self.min_phrase_frequency:
-                # Check if phrase contains sentiment words
-                is_positive = any(word in phrase.lower() for word in self.sentiment_words[language]["positive"])
-                is_negative = any(word in phrase.lower() for word in self.sentiment_words[language]["negative"])
-                
-                if is_positive and not is_negative:
-                    positive_phrases.append((phrase, count))
-                elif is_negative and not is_positive:
-                    negative_phrases.append((phrase, count))
-
-        # Calculate rating distribution
-        rating_dist = Counter(r for r in ratings if r is not None)
-        
         # Calculate average sentiment
-        avg_sentiment = sum(sentiments) / len(sentiments) if sentiments else 0
+        avg_sentiment = partial["sentiment_sum"] / partial["count"]
 
         return {
             "summary": {
-                "pros": positive_phrases[:3],  # Top 3 positive phrases
-                "cons": negative_phrases[:3]   # Top 3 negative phrases
+                "pros": positive_phrases,  # Top 3 positive phrases
+                "cons": negative_phrases   # Top 3 negative phrases
             },
             "sentiment_score": round(avg_sentiment, 2),
-            "rating_distribution": dict(rating_dist),
-            "total_reviews": len(reviews),
+            "rating_distribution": dict(partial["ratings"]),
+            "total_reviews": partial["count"],
             "language": language
         }
 
+    def split_phrases(
+        self,
+        phrase_counts: Iterable[Tuple[str, int]],
+        language: str,
+        limit: int = 3
+    ) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
+        """
+        Pick the top positive and negative phrases.
+
+        Args:
+            phrase_counts: (phrase, count) pairs, most frequent first
+            language: Language of the phrases
+            limit: Phrases to keep per polarity
+
+        Returns:
+            Tuple of (positive phrases, negative phrases) with their counts
+        """
+        positive_phrases = []
+        negative_phrases = []
+        
+        for phrase, count in phrase_counts:
+            # Pairs are sorted, so no later phrase is frequent enough either
+            if count < self.min_phrase_frequency:
+                break
+            if len(positive_phrases) >= limit and len(negative_phrases) >= limit:
+                break
+            # Check if phrase contains sentiment words
+            flags = [self._token_polarity(word, language) for word in phrase.split()]
+            is_positive = any(positive for positive, _ in flags)
+            is_negative = any(negative for _, negative in flags)
+            
+            if is_positive and not is_negative:
+                positive_phrases.append((phrase, count))
+            elif is_negative and not is_positive:
+                negative_phrases.append((phrase, count))
+
+        return positive_phrases[:limit], negative_phrases[:limit]
+
+    def shutdown(self) -> None:
+        """Stop the worker processes, if any were started."""
+        self._pool.shutdown()
+
     def _extract_phrases(self, text: str, language: str) -> List[str]:
-        """Extract meaningful phrases from text."""
+        """
+        Extract meaningful phrases from text.
+
+        Returns every min_phrase_length to max_phrase_length word window
+        that contains a sentiment word. Each token is checked once, then
+        only windows covering a sentiment token are joined.
+        """
         # Clean text
         text = re.sub(r'[^\w\s]', ' ', text)
         words = text.split()
+        n = len(words)
+        
+        # next_hit[i] is the first sentiment token position at or after i
+        next_hit = [n] * (n + 1)
+        for i in range(n - 1, -1, -1):
+            positive, negative = self._token_polarity(words[i], language)
+            next_hit[i] = i if positive or negative else next_hit[i + 1]
         
         phrases = []
-        for i in range(len(words)):
-            for j in range(self.min_phrase_length, self.max_phrase_length + 1):
-                if i + j <= len(words):
-                    phrase = ' '.join(words[i:i+j])
-                    # Only add phrases containing sentiment words
-                    if any(word in phrase.lower() for word in self.sentiment_words[language]["positive"]) or \
-                       any(word in phrase.lower() for word in self.sentiment_words[language]["negative"]):
-                        phrases.append(phrase)
+        for i in range(n):
+            # Windows starting at i that reach the next sentiment token
+            first = max(self.min_phrase_length, next_hit[i] - i + 1)
+            last = min(self.max_phrase_length, n - i)
+            for j in range(first, last + 1):
+                phrases.append(' '.join(words[i:i+j]))
         
         return phrases
 
+    def _token_polarity(self, token: str, language: str) -> Tuple[bool, bool]:
+        """Get whether a token contains a positive and/or a negative sentiment word."""
+        flags = self._token_flags.setdefault(language, {})
+        cached = flags.get(token)
+        if cached is not None:
+            return cached
+
+        patterns = self._sentiment_patterns.get(language)
+        if patterns is None:
+            # One alternation per polarity finds any of the words in a single scan
+            patterns = tuple(
+                re.compile('|'.join(re.escape(word) for word in self.sentiment_words[language][polarity]))
+                for polarity in ("positive", "negative")
+            )
+            self._sentiment_patterns[language] = patterns
+
+        lowered = token.lower()
+        result = (patterns[0].search(lowered) is not None, patterns[1].search(lowered) is not None)
+        # Bound the memo on open-ended vocabularies
+        if len(flags) >= 100000:
+            flags.clear()
+        flags[token] = result
+        return result
+
     def generate_summary(
         self,
         analysis_result: Dict[str, any],
@@ -167,6 +327,10 @@ class ReviewAnalyzer:
 
         return "\n".join(summary_parts)
 
-def create_review_analyzer() -> ReviewAnalyzer:
+def create_review_analyzer(
+    max_workers: Optional[int] = None,
+    chunk_size: int = 2000,
+    sentiment_backend: str = "textblob"
+) -> ReviewAnalyzer:
     """Helper function to create a review analyzer instance."""
-    return ReviewAnalyzer()
+    return ReviewAnalyzer(max_workers=max_workers, chunk_size=chunk_size, sentiment_backend=sentiment_backend)
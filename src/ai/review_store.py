@@ -0,0 +1,141 @@
+from typing import Any, Dict, List, Optional
+from .review_analyzer import ReviewAnalyzer, create_review_analyzer
+import os
+import sqlite3
+import threading
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS review_totals (
+    product_id TEXT NOT NULL,
+    language TEXT NOT NULL,
+    sentiment_sum REAL NOT NULL,
+    review_count INTEGER NOT NULL,
+    PRIMARY KEY (product_id, language)
+);
+CREATE TABLE IF NOT EXISTS review_phrases (
+    product_id TEXT NOT NULL,
+    language TEXT NOT NULL,
+    phrase TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (product_id, language, phrase)
+);
+CREATE INDEX IF NOT EXISTS review_phrases_by_count
+    ON review_phrases (product_id, language, count DESC);
+CREATE TABLE IF NOT EXISTS review_ratings (
+    product_id TEXT NOT NULL,
+    language TEXT NOT NULL,
+    rating NOT NULL,
+    count INTEGER NOT NULL,
+    PRIMARY KEY (product_id, language, rating)
+);
+"""
+
+class ReviewStore:
+    def __init__(self, path: str, analyzer: Optional[ReviewAnalyzer] = None):
+        """
+        Persisted per-product review aggregates in SQLite.
+
+        Each product keeps its phrase counts, sentiment sum and count and
+        rating histogram, so adding a review costs O(review length) and
+        analyses are served without reprocessing earlier reviews.
+
+        Args:
+            path: SQLite database file, created if missing
+            analyzer: Analyzer used to extract phrases and sentiment
+        """
+        self.path = path
+        self.analyzer = analyzer or create_review_analyzer()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(SCHEMA)
+        self._lock = threading.Lock()
+
+    def add_reviews(self, product_id: str, reviews: List[Dict[str, Any]], language: str = "en") -> int:
+        """
+        Fold new reviews into a product's aggregate.
+
+        Args:
+            product_id: Product the reviews belong to
+            reviews: Review dictionaries with 'text' and optional 'rating' keys
+            language: Language of reviews ('en' or 'hi')
+
+        Returns:
+            Total number of reviews now aggregated for the product
+        """
+        partial = self.analyzer.analyze_chunk(reviews, language)
+        key = (str(product_id), language)
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO review_totals VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (product_id, language) DO UPDATE SET "
+                "sentiment_sum = sentiment_sum + excluded.sentiment_sum, "
+                "review_count = review_count + excluded.review_count",
+                key + (partial["sentiment_sum"], partial["count"])
+            )
+            # Rows keep their rowid on update, so rowid preserves first-seen order for ties
+            self._conn.executemany(
+                "INSERT INTO review_phrases VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (product_id, language, phrase) DO UPDATE SET count = count + excluded.count",
+                (key + (phrase, count) for phrase, count in partial["phrases"].items())
+            )
+            self._conn.executemany(
+                "INSERT INTO review_ratings VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (product_id, language, rating) DO UPDATE SET count = count + excluded.count",
+                (key + (rating, count) for rating, count in partial["ratings"].items())
+            )
+            row = self._conn.execute(
+                "SELECT review_count FROM review_totals WHERE product_id = ? AND language = ?", key
+            ).fetchone()
+        return row[0]
+
+    def get_analysis(self, product_id: str, language: str = "en") -> Dict[str, Any]:
+        """
+        Get a product's analysis from its aggregate.
+
+        Returns the same structure as ReviewAnalyzer.analyze_reviews over
+        every review added so far.
+        """
+        key = (str(product_id), language)
+        with self._lock:
+            totals = self._conn.execute(
+                "SELECT sentiment_sum, review_count FROM review_totals WHERE product_id = ? AND language = ?", key
+            ).fetchone()
+            if totals is None or not totals[1]:
+                return self.analyzer.analyze_reviews([], language)
+
+            # Only frequent phrases are read, and only until both lists are full
+            phrases = self._conn.execute(
+                "SELECT phrase, count FROM review_phrases WHERE product_id = ? AND language = ? AND count >= ? "
+                "ORDER BY count DESC, rowid",
+                key + (self.analyzer.min_phrase_frequency,)
+            )
+            pros, cons = self.analyzer.split_phrases(phrases, language)
+            phrases.close()
+            ratings = self._conn.execute(
+                "SELECT rating, count FROM review_ratings WHERE product_id = ? AND language = ? ORDER BY rowid", key
+            ).fetchall()
+
+        sentiment_sum, review_count = totals
+        return {
+            "summary": {"pros": pros, "cons": cons},
+            "sentiment_score": round(sentiment_sum / review_count, 2),
+            "rating_distribution": dict(ratings),
+            "total_reviews": review_count,
+            "language": language
+        }
+
+    def delete_product(self, product_id: str) -> None:
+        """Drop every aggregate kept for a product."""
+        with self._lock, self._conn:
+            for table in ("review_totals", "review_phrases", "review_ratings"):
+                self._conn.execute(f"DELETE FROM {table} WHERE product_id = ?", (str(product_id),))
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+def create_review_store(path: str, analyzer: Optional[ReviewAnalyzer] = None) -> ReviewStore:
+    """Helper function to create a review store instance."""
+    return ReviewStore(path, analyzer=analyzer)
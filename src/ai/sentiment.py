@@ -0,0 +1,132 @@
+from scipy.sparse import csr_matrix
+from typing import Dict, List
+import numpy as np
+import re
+
+# Word polarities on TextBlob's -1..1 scale
+LEXICON = {
+    "en": {
+        "good": 0.7, "great": 0.8, "excellent": 1.0, "perfect": 1.0, "comfortable": 0.4,
+        "quality": 0.3, "recommend": 0.4, "recommended": 0.4, "best": 1.0, "love": 0.5,
+        "loved": 0.7, "amazing": 0.6, "awesome": 1.0, "nice": 0.6, "happy": 0.8,
+        "okay": 0.5, "ok": 0.5, "easy": 0.4, "sturdy": 0.3, "soft": 0.1, "worth": 0.3, "beautiful": 0.85,
+        "fantastic": 0.4, "wonderful": 1.0, "satisfied": 0.5, "durable": 0.3, "safe": 0.5,
+        "bad": -0.7, "poor": -0.4, "uncomfortable": -0.5, "expensive": -0.5, "difficult": -0.5,
+        "hard": -0.3, "waste": -0.2, "disappointed": -0.75, "disappointing": -0.6, "broken": -0.4,
+        "cheap": -0.3, "terrible": -1.0, "awful": -1.0, "worst": -1.0, "useless": -0.5,
+        "flimsy": -0.3, "horrible": -1.0, "defective": -0.5, "leaks": -0.3, "smelly": -0.5
+    },
+    "hi": {
+        "अच्छा": 0.7, "अच्छी": 0.7, "अच्छे": 0.7, "बढ़िया": 0.8, "उत्कृष्ट": 1.0,
+        "सही": 0.4, "आरामदायक": 0.4, "गुणवत्ता": 0.3, "सिफारिश": 0.4, "बेस्ट": 1.0,
+        "पसंद": 0.5, "शानदार": 0.8, "मजबूत": 0.3, "सुंदर": 0.8, "खुश": 0.8,
+        "खराब": -0.7, "घटिया": -0.8, "असुविधाजनक": -0.5, "महंगा": -0.5, "मुश्किल": -0.5,
+        "कठिन": -0.3, "बेकार": -0.6, "निराश": -0.75, "टूटा": -0.4, "टूटी": -0.4,
+        "सस्ता": -0.3, "बुरा": -0.7
+    }
+}
+
+# Negators flip the polarity of the nearest lexicon word in scope; English
+# negates a following word, Hindi (negator after the verb) a preceding one
+NEGATORS = {
+    "en": {"not", "no", "never", "nothing", "hardly", "without", "isn't", "wasn't", "don't", "doesn't", "didn't"},
+    "hi": {"नहीं", "न", "मत", "ना"}
+}
+NEGATION_SCOPE = {"en": 3, "hi": -2}
+# TextBlob scales negated polarity by -0.5 rather than flipping it outright
+NEGATION_FACTOR = -0.5
+
+# Devanagari vowel signs are not \w, so they are matched explicitly
+TOKEN_PATTERN = re.compile(r"[\w\u0900-\u097F']+")
+
+class TextBlobSentiment:
+    """Per-review TextBlob polarity, the original scorer."""
+    name = "textblob"
+
+    def __init__(self):
+        # Imported here so the lexicon backend never pays for loading TextBlob
+        from textblob import TextBlob
+        self._textblob = TextBlob
+
+    def score_batch(self, texts: List[str], language: str = "en") -> List[float]:
+        return [self._textblob(text).sentiment.polarity for text in texts]
+
+class LexiconSentiment:
+    name = "lexicon"
+
+    def __init__(self, lexicon: Dict[str, Dict[str, float]] = LEXICON):
+        """
+        Lexicon polarity scorer for English and Hindi.
+
+        Every word and its negated form are compiled to adjacent columns of a
+        weight vector. A batch of reviews becomes one sparse document-term matrix,
+        and the polarity of each review is its mean matched word weight,
+        (X @ w) / (X @ 1).
+
+        Args:
+            lexicon: Word polarities per language
+        """
+        self._columns = {}
+        self._weights = {}
+        for language, words in lexicon.items():
+            columns = {}
+            weights = []
+            for word, weight in words.items():
+                # The negated form is the next column
+                columns[word] = len(weights)
+                weights.extend([weight, weight * NEGATION_FACTOR])
+            self._columns[language] = columns
+            self._weights[language] = np.asarray(weights, dtype=np.float64)
+
+    def score_batch(self, texts: List[str], language: str = "en") -> List[float]:
+        """Score a batch of reviews, returning one polarity per text."""
+        matrix = self.document_term_matrix(texts, language)
+        weighted = matrix @ self._weights[language]
+        hits = np.asarray(matrix.sum(axis=1)).ravel()
+        return (weighted / np.maximum(hits, 1)).tolist()
+
+    def document_term_matrix(self, texts: List[str], language: str = "en") -> csr_matrix:
+        """Build the sparse count matrix of lexicon words (and negated words) per text."""
+        columns = self._columns[language]
+        negators = NEGATORS[language]
+        scope = NEGATION_SCOPE[language]
+        indices = []
+        indptr = [0]
+        for text in texts:
+            row = []
+            last_match = 0
+            negate_until = -1
+            for i, token in enumerate(TOKEN_PATTERN.findall(text.lower())):
+                if token in negators or token.endswith("n't"):
+                    if scope > 0:
+                        negate_until = i + scope
+                    elif row and i - last_match <= -scope and row[-1] % 2 == 0:
+                        # Plain word columns are even, negated ones odd
+                        row[-1] += 1
+                    continue
+                column = columns.get(token)
+                if column is None:
+                    continue
+                if i <= negate_until:
+                    column += 1
+                    negate_until = -1
+                row.append(column)
+                last_match = i
+            indices.extend(row)
+            indptr.append(len(indices))
+        data = np.ones(len(indices), dtype=np.float64)
+        return csr_matrix(
+            (data, np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+            shape=(len(texts), len(self._weights[language]))
+        )
+
+SENTIMENT_BACKENDS = {
+    "textblob": TextBlobSentiment,
+    "lexicon": LexiconSentiment
+}
+
+def create_sentiment_backend(name: str = "textblob"):
+    """Helper function to create a sentiment backend by name."""
+    if name not in SENTIMENT_BACKENDS:
+        raise ValueError(f"Unknown sentiment backend: {name}. Choose from {sorted(SENTIMENT_BACKENDS)}")
+    return SENTIMENT_BACKENDS[name]()
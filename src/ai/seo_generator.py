@@ -1,7 +1,51 @@
-from typing import Dict, List, Optional
+import json
+import os
+import string
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+from .cache import LRUCache
+
+DEFAULT_CATALOG_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'products.json')
+
+def compile_template(template: str) -> str:
+    """
+    Compile a str.format template into an equivalent %-style template.
+
+    %-formatting against a mapping skips the per-call format string parsing
+    and keyword unpacking of str.format, which dominates batch rendering.
+
+    Args:
+        template: Template with plain {field} placeholders
+
+    Returns:
+        Template for use as template % context
+    """
+    parts = []
+    for literal, field, spec, conversion in string.Formatter().parse(template):
+        parts.append(literal.replace("%", "%%"))
+        if field is None:
+            continue
+        if spec or conversion not in (None, "s"):
+            raise ValueError(f"Unsupported placeholder in SEO template: {{{field}}}")
+        parts.append(f"%({field})s")
+    return "".join(parts)
+
+def iter_catalog(path: Optional[str] = None) -> Iterator[Dict]:
+    """Yield the products of a catalog JSON file, products.json by default."""
+    with open(path or DEFAULT_CATALOG_PATH, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    yield from data.get("products", [])
+
+# Product fields the rendered metadata depends on
+CONTENT_FIELDS = ("name", "brand", "category", "discount", "image")
 
 class SEOGenerator:
-    def __init__(self):
+    def __init__(self, cache_size: int = 4096):
+        """
+        Initialize the SEO generator.
+
+        Args:
+            cache_size: Maximum memoized results, keyed by product content, language and template type
+        """
         self.templates = {
             "title": {
                 "en": {
@@ -63,6 +107,10 @@ class SEOGenerator:
             }
         }
 
+        # Compiled templates per (language, template_type), built on first use
+        self._compiled_templates = {}
+        self.seo_cache = LRUCache(max_size=cache_size)
+
     def generate_seo(
         self,
         product: Dict,
@@ -70,11 +118,117 @@ class SEOGenerator:
         template_type: str = "default"
     ) -> Dict[str, str]:
         """Generate SEO metadata for a product."""
+        cache_key = self._content_key(product, language, template_type)
+        if cache_key is not None:
+            cached = self.seo_cache.get(cache_key)
+            if cached is not None:
+                return dict(cached)
+
+        seo_data = self._render(product, language, self._compiled(language, template_type))
+        if cache_key is not None:
+            self.seo_cache.set(cache_key, seo_data)
+            return dict(seo_data)
+        return seo_data
+
+    def generate_seo_batch(
+        self,
+        products: Iterable[Dict],
+        language: str = "en",
+        template_type: str = "default"
+    ) -> Iterator[Dict[str, str]]:
+        """
+        Generate SEO metadata for many products.
+
+        Templates are compiled once for the language and template type and
+        results are yielded one product at a time, so a full catalog can be
+        streamed (see iter_catalog) without holding every result in memory.
+        Results bypass the memo cache so a catalog run does not flush it.
+
+        Args:
+            products: Iterable of product dictionaries
+            language: Language code
+            template_type: Template type, one of get_template_types()
+
+        Returns:
+            Iterator of SEO metadata dictionaries in input order
+        """
+        compiled = self._compiled(language, template_type)
+        for product in products:
+            yield self._render(product, language, compiled)
+
+    def warm_cache(
+        self,
+        products: Iterable[Dict],
+        languages: Optional[List[str]] = None,
+        template_types: Optional[List[str]] = None
+    ) -> int:
+        """
+        Precompute memoized results for products, e.g. the catalog at startup.
+
+        Only the hot combination (English, default template) is warmed unless
+        asked otherwise, and warming stops once the cache is full so it never
+        evicts its own results.
+
+        Args:
+            products: Product dictionaries to render
+            languages: Languages to render, ['en'] by default
+            template_types: Template types to render, ['default'] by default
+
+        Returns:
+            Number of results added to the cache
+        """
+        products = list(products)
+        size_before = len(self.seo_cache)
+        for language in languages or ["en"]:
+            for template_type in template_types or ["default"]:
+                results = self.generate_seo_batch(products, language=language, template_type=template_type)
+                for product, seo_data in zip(products, results):
+                    if len(self.seo_cache) >= self.seo_cache.max_size:
+                        return len(self.seo_cache) - size_before
+                    cache_key = self._content_key(product, language, template_type)
+                    if cache_key is not None:
+                        self.seo_cache.set(cache_key, seo_data)
+        return len(self.seo_cache) - size_before
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get SEO result cache hit/miss/eviction counters."""
+        return self.seo_cache.get_stats()
+
+    def _content_key(self, product: Dict, language: str, template_type: str) -> Optional[str]:
+        """
+        Cache key from the product fields used in rendering, or None if they cannot be serialized.
+
+        The fields are JSON encoded rather than compared as values, since
+        values that compare equal can render differently (20 and 20.0, 1 and True).
+        """
+        try:
+            # Same defaults as _render, so a missing field and an explicit None stay distinct
+            content = json.dumps([product.get(field, "") for field in CONTENT_FIELDS], ensure_ascii=False)
+        except (TypeError, ValueError):
+            return None
+        return f"{language}\0{template_type}\0{content}"
+
+    def _compiled(self, language: str, template_type: str) -> Dict[str, str]:
+        """Get the compiled title, description and keywords templates."""
+        key = (language, template_type)
+        compiled = self._compiled_templates.get(key)
+        if compiled is None:
+            compiled = {
+                "title": compile_template(self.templates["title"][language][template_type]),
+                "description": compile_template(self.templates["description"][language][template_type]),
+                # All keyword templates render as one comma separated string
+                "keywords": compile_template(", ".join(self.templates["keywords"][language]))
+            }
+            self._compiled_templates[key] = compiled
+        return compiled
+
+    def _render(self, product: Dict, language: str, compiled: Dict[str, str]) -> Dict[str, str]:
+        """Render compiled templates for a product."""
         
         # Get category features
         category_features = self.category_features.get(product.get('category', ''), {
             "en": [], "hi": []
-        })
+        })[language]
         
         # Create context with all variables
         context = {
@@ -82,40 +236,35 @@ class SEOGenerator:
             "brand": product.get("brand", ""),
             "category": product.get("category", ""),
             "discount": product.get("discount", ""),
-            "key_feature": category_features[language][0] if category_features[language] else ""
+            "key_feature": category_features[0] if category_features else ""
         }
 
-        # Generate title
-        title = self.templates["title"][language][template_type].format(**context)
-        
-        # Generate description
-        description = self.templates["description"][language][template_type].format(**context)
-        
-        # Generate keywords
-        keywords = [
-            keyword.format(**context)
-            for keyword in self.templates["keywords"][language]
-        ]
+        # Generate title and description
+        title = compiled["title"] % context
+        description = compiled["description"] % context
         
-        # Add category-specific keywords
-        keywords.extend(category_features[language])
+        # Generate keywords and add category-specific keywords
+        keywords = compiled["keywords"] % context
+        if category_features:
+            keywords = ", ".join([keywords] + category_features)
 
         # Ensure title and description lengths are appropriate for SEO
         title = self._truncate_title(title)
         description = self._truncate_description(description)
+        image = product.get("image", "")
 
         return {
             "title": title,
             "description": description,
-            "keywords": ", ".join(keywords),
+            "keywords": keywords,
             "og:title": title,
             "og:description": description,
             "og:type": "product",
-            "og:image": product.get("image", ""),
+            "og:image": image,
             "twitter:card": "product",
             "twitter:title": title,
             "twitter:description": description,
-            "twitter:image": product.get("image", "")
+            "twitter:image": image
         }
 
     def _truncate_title(self, title: str, max_length: int = 60) -> str:
@@ -138,6 +287,6 @@ class SEOGenerator:
         """Get list of available template types."""
         return ["default", "sale", "new"]
 
-def create_seo_generator() -> SEOGenerator:
+def create_seo_generator(cache_size: int = 4096) -> SEOGenerator:
     """Helper function to create a SEO generator instance."""
-    return SEOGenerator()
+    return SEOGenerator(cache_size=cache_size)
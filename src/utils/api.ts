@@ -49,6 +49,27 @@ export async function getRecommendations(productId: string) {
   }
 }
 
+export async function getBatchRecommendations(
+  productIds: string[],
+  options: { numRecommendations?: number; basket?: boolean } = {}
+) {
+  try {
+    const response = await fetch(`${AI_API_BASE}/recommend/batch`, {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify({
+        product_ids: productIds,
+        num_recommendations: options.numRecommendations ?? 3,
+        basket: options.basket ?? false
+      })
+    });
+    return await handleResponse(response);
+  } catch (error) {
+    console.error('Failed to fetch batch recommendations:', error);
+    return { recommendations: options.basket ? [] : {} };
+  }
+}
+
 export async function getFAQAnswer(question: string, language: string = 'en') {
   try {
     const response = await fetch(
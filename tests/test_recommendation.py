@@ -0,0 +1,130 @@
+import random
+import shutil
+import tempfile
+import unittest
+
+import numpy as np
+
+from src.ai.recommendation import ProductRecommender
+
+WORDS = (
+    "soft cotton baby blanket warm stroller light foldable toy wooden bottle glass "
+    "diaper bag car seat organic gentle lotion rattle musical crib sheet bib"
+).split()
+CATEGORIES = ["Diapers", "Strollers", "Toys", "Feeding", "Bedding"]
+BRANDS = ["Pampers", "Chicco", "Fisher", "Philips", "Mee"]
+
+def make_product(rng: random.Random, product_id, extra_words=()) -> dict:
+    words = list(WORDS) + list(extra_words)
+    return {
+        'id': product_id,
+        'name': ' '.join(rng.sample(words, 3)),
+        'description': ' '.join(rng.sample(words, 6)),
+        'category': rng.choice(CATEGORIES),
+        'brand': rng.choice(BRANDS)
+    }
+
+class IncrementalUpdateTest(unittest.TestCase):
+    def setUp(self):
+        self.rng = random.Random(7)
+        self.recommender = ProductRecommender(
+            [make_product(self.rng, i) for i in range(60)],
+            num_neighbors=5,
+            block_size=7
+        )
+
+    def assert_index_matches_brute_force(self):
+        """The neighbor index must equal a top-K over the full similarity matrix."""
+        recommender = self.recommender
+        n_products = len(recommender.product_ids)
+        self.assertEqual(recommender.tfidf_matrix.shape[0], n_products)
+        self.assertEqual(recommender.neighbor_ids.shape[0], n_products)
+        self.assertEqual(
+            recommender.product_indices,
+            {pid: idx for idx, pid in enumerate(recommender.product_ids)}
+        )
+
+        # Every row holds its product's current content
+        expected_rows = recommender.vectorizer.transform(
+            [recommender._product_features(recommender.products[pid]) for pid in recommender.product_ids]
+        )
+        np.testing.assert_allclose(recommender.tfidf_matrix.toarray(), expected_rows.toarray(), atol=1e-6)
+
+        similarities = (recommender.tfidf_matrix @ recommender.tfidf_matrix.T).toarray()
+        np.fill_diagonal(similarities, -np.inf)
+        k = min(recommender.num_neighbors, n_products - 1)
+        expected_scores = -np.sort(-similarities, axis=1)[:, :k]
+
+        # Compared by score, since ties may list different but equally similar products
+        np.testing.assert_allclose(recommender.neighbor_scores, expected_scores, atol=1e-5)
+        listed = np.take_along_axis(similarities, recommender.neighbor_ids.astype(np.int64), axis=1)
+        np.testing.assert_allclose(listed, recommender.neighbor_scores, atol=1e-5)
+        for row, ids in enumerate(recommender.neighbor_ids):
+            self.assertNotIn(row, ids)
+            self.assertEqual(len(set(ids)), len(ids))
+
+    def test_mixed_updates_match_brute_force(self):
+        recommender = self.recommender
+        self.assert_index_matches_brute_force()
+
+        recommender.add_products([make_product(self.rng, f"new-{i}") for i in range(10)])
+        self.assert_index_matches_brute_force()
+
+        for product_id in (0, 5, 17, "new-3"):
+            recommender.update_product(make_product(self.rng, product_id))
+            self.assert_index_matches_brute_force()
+
+        recommender.remove_products([3, "new-1", 40, 41, 59])
+        self.assert_index_matches_brute_force()
+
+        # Adding an existing ID updates it; words outside the vocabulary are ignored
+        recommender.add_products([
+            make_product(self.rng, 5),
+            make_product(self.rng, "new-10", extra_words=["teether", "swaddle"])
+        ])
+        self.assert_index_matches_brute_force()
+        self.assertGreater(recommender.get_vocabulary_drift(), 0)
+
+        recommender.remove_products(["unknown"])
+        recommender.update_product(make_product(self.rng, "new-11"))
+        self.assert_index_matches_brute_force()
+        self.assertIn("new-11", recommender.product_indices)
+
+    def test_repeated_new_id_is_added_once(self):
+        recommender = self.recommender
+        first, last = make_product(self.rng, "x"), make_product(self.rng, "x")
+        recommender.add_products([first, make_product(self.rng, "y"), last])
+        self.assertEqual(recommender.product_ids.count("x"), 1)
+        self.assertIs(recommender.products["x"], last)
+        self.assert_index_matches_brute_force()
+
+        recommender.remove_products(["x"])
+        self.assertNotIn("x", recommender.product_ids)
+        self.assert_index_matches_brute_force()
+
+    def test_removal_below_k_rebuilds_index(self):
+        recommender = self.recommender
+        recommender.remove_products(list(range(56)))
+        self.assertEqual(recommender.neighbor_ids.shape, (4, 3))
+        self.assert_index_matches_brute_force()
+
+        recommender.add_products([make_product(self.rng, f"new-{i}") for i in range(4)])
+        self.assertEqual(recommender.neighbor_ids.shape, (8, 5))
+        self.assert_index_matches_brute_force()
+
+    def test_updates_after_load_copy_mapped_arrays(self):
+        path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, path)
+        self.recommender.save(path)
+
+        self.recommender = ProductRecommender.load(path, block_size=7)
+        self.recommender.add_products([make_product(self.rng, "new-0")])
+        self.recommender.update_product(make_product(self.rng, 1))
+        self.recommender.remove_products([2])
+        self.assert_index_matches_brute_force()
+
+        # The artifact on disk is untouched by in-memory updates
+        self.assertEqual(len(ProductRecommender.load(path).product_ids), 60)
+
+if __name__ == '__main__':
+    unittest.main()